@@ -0,0 +1,507 @@
+"""
+Benchmarks for college_scraper.py.
+
+Usage:
+    python server/bench_scraper.py division [--rows N] [--repeat N]
+    python server/bench_scraper.py parsers [--rows N] [--repeat N]
+    python server/bench_scraper.py parity [FILE ...]
+    python server/bench_scraper.py corpus [--repeat N] [--min-accuracy F] [--max-p95 MS]
+    python server/bench_scraper.py async [--repeat N]
+    python server/bench_scraper.py pipeline [--parse-workers N] [--threads N] [--repeat N]
+    python server/bench_scraper.py memory [--rows N] [--rounds N] [--max-growth MIB]
+
+The corpus command replays the recorded sites in server/scraper_corpus
+through local HTTP servers, so it runs fully offline.
+"""
+import argparse
+import asyncio
+import functools
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+import warnings
+from contextlib import contextmanager
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urljoin
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bs4 import BeautifulSoup
+
+import college_scraper
+
+CORPUS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scraper_corpus')
+
+def legacy_guess_division(text, soup=None):
+    """guess_division as it was before the single-pass text index, kept for comparison."""
+    if soup:
+        division_elements = soup.select('*:contains("Division I"), *:contains("Division II"), *:contains("Division III"), *:contains("NCAA I"), *:contains("NCAA II"), *:contains("NCAA III")')
+
+        for element in division_elements:
+            element_text = element.get_text()
+            if "Division I" in element_text or "NCAA I" in element_text or "NCAA Division I" in element_text:
+                return "Division I"
+            elif "Division II" in element_text or "NCAA II" in element_text or "NCAA Division II" in element_text:
+                return "Division II"
+            elif "Division III" in element_text or "NCAA Division III" in element_text or "NCAA III" in element_text:
+                return "Division III"
+
+    return college_scraper.guess_division(text)
+
+def build_large_page(rows):
+    """A Sidearm-style athletics page: deep nav, a long roster table and a footer."""
+    nav = ''.join(
+        f'<li class="nav-item"><div><a href="/sports/sport-{i}"><span>Sport {i}</span></a></div></li>'
+        for i in range(80)
+    )
+    roster = ''.join(
+        f'<tr class="roster-row"><td><div><span><a href="/roster/{i}">Athlete Number{i}</a></span></div></td>'
+        f'<td><span>Jr.</span></td><td><span>Hometown {i}, ST</span></td></tr>'
+        for i in range(rows)
+    )
+    return (
+        '<html><head><title>Swimming and Diving - Example Athletics</title></head><body>'
+        f'<header><nav><ul>{nav}</ul></nav></header>'
+        f'<main><div class="container"><table class="roster">{roster}</table></div></main>'
+        '<footer><div><p>Example University is a member of the NCAA Division III.</p></div></footer>'
+        '</body></html>'
+    )
+
+def time_call(func, repeat):
+    """Best wall time of func over repeat runs, and its last result."""
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+def bench_division(rows, repeat):
+    html = build_large_page(rows)
+    soup = BeautifulSoup(html, 'html.parser')
+    text = soup.get_text()
+
+    with warnings.catch_warnings():
+        # soupsieve warns that :contains is deprecated
+        warnings.simplefilter('ignore')
+        legacy_time, legacy_result = time_call(lambda: legacy_guess_division(text, soup), repeat)
+    current_time, current_result = time_call(lambda: college_scraper.guess_division(text, soup), repeat)
+
+    print(f"page size: {len(html) / 1024:.0f} KiB, roster rows: {rows}")
+    print(f"legacy :contains selectors  {legacy_time * 1000:9.1f} ms  -> {legacy_result}")
+    print(f"single-pass text index      {current_time * 1000:9.1f} ms  -> {current_result}")
+    if current_time:
+        print(f"speedup: {legacy_time / current_time:.1f}x")
+    if legacy_result != current_result:
+        print("WARNING: results differ")
+        return 1
+    return 0
+
+def available_backends():
+    """Parser backends whose libraries are installed here."""
+    backends = []
+    for backend in college_scraper.PARSER_BACKENDS:
+        try:
+            college_scraper.build_document('<html></html>', backend=backend)
+        except ImportError:
+            continue
+        backends.append(backend)
+    return backends
+
+def bench_parsers(rows, repeat):
+    """Time a full extraction of the generated page with every installed backend."""
+    html = build_large_page(rows)
+    url = 'https://example.edu/sports/swimming-and-diving'
+    print(f"page size: {len(html) / 1024:.0f} KiB, roster rows: {rows}")
+
+    baseline = None
+    for backend in available_backends():
+        parse_time, _ = time_call(lambda: college_scraper.build_document(html, backend=backend), repeat)
+        total_time, result = time_call(lambda: college_scraper.extract_college_info(html, url, backend=backend), repeat)
+        baseline = baseline or parse_time
+        print(f"{backend:12s} parse {parse_time * 1000:8.1f} ms ({baseline / parse_time:4.1f}x)  extract {total_time * 1000:8.1f} ms")
+    return 0
+
+def check_parity(paths):
+    """
+    Extract every page with every installed backend and compare the JSON.
+
+    Without paths the corpus team pages and the generated benchmark page are
+    used. Returns 1 if any backend disagrees with html.parser.
+    """
+    pages = []
+    for path in paths or corpus_team_pages():
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            pages.append((path, f.read()))
+    if not paths:
+        pages.append(('<generated page>', build_large_page(200)))
+
+    backends = available_backends()
+    failures = 0
+    for name, html in pages:
+        url = 'https://example.edu/sports/swimming-and-diving'
+        expected = college_scraper.extract_college_info(html, url, backend='html.parser')
+        for backend in backends:
+            if backend == 'html.parser':
+                continue
+            result = college_scraper.extract_college_info(html, url, backend=backend)
+            if result != expected:
+                failures += 1
+                print(f"MISMATCH {name} [{backend}]")
+                for section in ('college', 'team'):
+                    for key, value in expected[section].items():
+                        if result[section].get(key) != value:
+                            print(f"  {section}.{key}: html.parser={value!r} {backend}={result[section].get(key)!r}")
+
+    print(f"{len(pages)} page(s), backends: {', '.join(backends)}, mismatches: {failures}")
+    return 1 if failures else 0
+
+def load_golden():
+    """Expected outputs for the recorded corpus, keyed by site directory."""
+    with open(os.path.join(CORPUS_DIR, 'golden.json'), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def corpus_file(site, path):
+    """Path on disk of the corpus page served at path for site."""
+    path = path.lstrip('/')
+    if not path or path.endswith('/'):
+        path += 'index.html'
+    return os.path.join(CORPUS_DIR, site, path)
+
+def corpus_team_pages():
+    return [corpus_file(site, expected['teamPage']) for site, expected in load_golden().items()]
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        # Don't print request lines, they drown out the report
+        pass
+
+class QuietServer(ThreadingHTTPServer):
+    def handle_error(self, request, client_address):
+        # Discovery drops connections it no longer needs, that isn't a failure
+        if isinstance(sys.exc_info()[1], ConnectionError):
+            return
+        super().handle_error(request, client_address)
+
+@contextmanager
+def corpus_servers(sites):
+    """Serve each corpus site from its own local port and yield {site: base_url}."""
+    servers = {}
+    try:
+        for site in sites:
+            handler = functools.partial(QuietHandler, directory=os.path.join(CORPUS_DIR, site))
+            server = QuietServer(('127.0.0.1', 0), handler)
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            servers[site] = server
+        yield {site: f"http://127.0.0.1:{server.server_address[1]}/" for site, server in servers.items()}
+    finally:
+        for server in servers.values():
+            server.shutdown()
+            server.server_close()
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+def field_matches(key, actual, expected, base_url):
+    """Compare one golden field; list items only on the keys the golden names."""
+    if isinstance(expected, list):
+        if not isinstance(actual, list) or len(actual) != len(expected):
+            return False
+        return all(
+            all(item.get(k) == v for k, v in want.items())
+            for item, want in zip(actual, expected)
+        )
+    if key in ('logo', 'coachPhoto') and actual and expected:
+        return urljoin(base_url, actual) == urljoin(base_url, expected)
+    return actual == expected
+
+def score_result(result, expected, base_url):
+    """Return {"section.field": bool} for every field in the golden entry."""
+    scores = {}
+    for section in ('college', 'team'):
+        got = result.get(section) or {}
+        for key, value in expected.get(section, {}).items():
+            scores[f"{section}.{key}"] = field_matches(key, got.get(key), value, base_url)
+    return scores
+
+def extractor_stages(html, url):
+    """Run the extract_college_info pipeline one stage at a time and time each stage."""
+    timings = {}
+
+    def stage(name, func):
+        start = time.perf_counter()
+        value = func()
+        timings[name] = time.perf_counter() - start
+        return value
+
+    domain = college_scraper.extract_domain(url)
+    doc = stage('parse', lambda: college_scraper.build_document(html))
+    text = stage('textExtract', lambda: college_scraper.trafilatura.extract(html) or doc.text())
+    stage('collegeName', lambda: college_scraper.get_college_name(text, domain, doc))
+    stage('logo', lambda: college_scraper.get_college_logo(doc, url))
+    stage('division', lambda: college_scraper.guess_division(text, doc))
+    stage('coach', lambda: college_scraper.extract_coach_info(text, doc))
+    stage('team', lambda: college_scraper.find_team_info(text, doc))
+    return timings
+
+def format_latencies(label, values):
+    ms = [v * 1000 for v in values]
+    return f"{label:14s} p50 {percentile(ms, 50):8.2f} ms  p95 {percentile(ms, 95):8.2f} ms  max {max(ms):8.2f} ms"
+
+def bench_corpus(repeat, min_accuracy=None, max_p95=None):
+    """
+    Replay the recorded corpus end to end and through each extractor.
+
+    Reports throughput, p50/p95 latency, peak traced memory and field-level
+    accuracy against golden.json. Returns 1 if a --min-accuracy or --max-p95
+    gate fails.
+    """
+    golden = load_golden()
+    # Every fetch must hit the local servers, not a warm cache
+    college_scraper.configure_fetch_client(cache=None)
+
+    with corpus_servers(golden) as base_urls:
+        latencies = []
+        results = {}
+        started = time.perf_counter()
+        for _ in range(repeat):
+            for site, expected in golden.items():
+                url = urljoin(base_urls[site], expected['start'])
+                start = time.perf_counter()
+                results[site] = college_scraper.scrape_college_info(url, use_cache=False)
+                latencies.append(time.perf_counter() - start)
+        wall = time.perf_counter() - started
+
+        # Peak memory is traced in a separate pass, tracemalloc slows everything down
+        peaks = {}
+        for site, expected in golden.items():
+            tracemalloc.start()
+            college_scraper.scrape_college_info(urljoin(base_urls[site], expected['start']), use_cache=False)
+            peaks[site] = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+    stages = {}
+    for _ in range(repeat):
+        for site, expected in golden.items():
+            with open(corpus_file(site, expected['teamPage']), 'r', encoding='utf-8') as f:
+                html = f.read()
+            url = urljoin('https://corpus.example/', expected['teamPage'])
+            for name, elapsed in extractor_stages(html, url).items():
+                stages.setdefault(name, []).append(elapsed)
+
+    print(f"corpus: {len(golden)} sites, {repeat} run(s) each")
+    print(f"throughput     {len(latencies) / wall:8.1f} scrapes/s")
+    print(format_latencies("end to end", latencies))
+    for name, values in stages.items():
+        print(format_latencies(name, values))
+    heaviest = max(peaks, key=peaks.get)
+    print(f"peak memory    {peaks[heaviest] / 1024:8.0f} KiB ({heaviest})")
+
+    fields = {}
+    for site, expected in golden.items():
+        base_url = urljoin(base_urls[site], expected['teamPage'])
+        for field, ok in score_result(results[site], expected, base_url).items():
+            fields.setdefault(field, []).append(ok)
+            if not ok:
+                print(f"  miss {site} {field}")
+    total = sum(len(v) for v in fields.values())
+    correct = sum(sum(v) for v in fields.values())
+    for field, oks in fields.items():
+        print(f"accuracy {field:20s} {sum(oks)}/{len(oks)}")
+    accuracy = correct / total if total else 1.0
+    print(f"accuracy overall {accuracy:.1%} ({correct}/{total} fields)")
+
+    status = 0
+    if min_accuracy is not None and accuracy < min_accuracy:
+        print(f"FAIL: accuracy {accuracy:.1%} is below {min_accuracy:.1%}")
+        status = 1
+    p95 = percentile(latencies, 95) * 1000
+    if max_p95 is not None and p95 > max_p95:
+        print(f"FAIL: end to end p95 {p95:.1f} ms is above {max_p95:.1f} ms")
+        status = 1
+    return status
+
+def comparable(result):
+    """A scrape result without the fields that legitimately differ between runs."""
+    return {key: value for key, value in result.items() if key not in ('timings', 'diagnostics')}
+
+def bench_async(repeat):
+    """
+    Check that scrape_college_info_async returns what scrape_college_info does
+    on the corpus, then compare sequential sync scrapes with concurrent async
+    ones on a single event loop. Returns 1 on any mismatch.
+    """
+    golden = load_golden()
+    college_scraper.configure_fetch_client(cache=None)
+
+    with corpus_servers(golden) as base_urls:
+        urls = [urljoin(base_urls[site], expected['start']) for site, expected in golden.items()]
+
+        mismatches = 0
+        for url in urls:
+            expected = comparable(college_scraper.scrape_college_info(url, use_cache=False))
+            actual = comparable(asyncio.run(college_scraper.scrape_college_info_async(url, use_cache=False)))
+            if actual != expected:
+                print(f"MISMATCH {url}")
+                print(f"  sync  {json.dumps(expected, sort_keys=True)}")
+                print(f"  async {json.dumps(actual, sort_keys=True)}")
+                mismatches += 1
+        print(f"parity: {len(urls) - mismatches}/{len(urls)} sites identical")
+
+        lookups = urls * repeat
+        start = time.perf_counter()
+        for url in lookups:
+            college_scraper.scrape_college_info(url, use_cache=False)
+        sync_wall = time.perf_counter() - start
+
+        async def scrape_all():
+            return await asyncio.gather(*(
+                college_scraper.scrape_college_info_async(url, use_cache=False) for url in lookups
+            ))
+
+        start = time.perf_counter()
+        results = asyncio.run(scrape_all())
+        async_wall = time.perf_counter() - start
+
+    failed = sum(1 for result in results if not result.get("success"))
+    print(f"sync sequential {len(lookups) / sync_wall:8.1f} scrapes/s ({len(lookups)} lookups)")
+    print(f"async gathered  {len(lookups) / async_wall:8.1f} scrapes/s ({failed} failed)")
+    return int(mismatches > 0 or failed > 0)
+
+def bench_pipeline(parse_workers, threads, repeat):
+    """
+    Scrape the corpus from a pool of fetching threads, first parsing in those
+    threads and then in parse_workers processes. Reports throughput for both
+    and returns 1 if the results differ.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    golden = load_golden()
+    college_scraper.configure_fetch_client(cache=None)
+    threads = threads or max(college_scraper.BATCH_WORKERS, parse_workers * college_scraper.PARSE_QUEUE_DEPTH)
+
+    with corpus_servers(golden) as base_urls:
+        urls = [urljoin(base_urls[site], expected['start']) for site, expected in golden.items()]
+        lookups = urls * repeat
+
+        runs = {}
+        for workers in (0, parse_workers):
+            college_scraper.configure_parse_pool(workers)
+            if workers:
+                # Start the processes outside the timed run
+                college_scraper.scrape_college_info(urls[0], use_cache=False)
+            with ThreadPoolExecutor(max_workers=threads) as executor:
+                start = time.perf_counter()
+                results = list(executor.map(lambda url: college_scraper.scrape_college_info(url, use_cache=False), lookups))
+                wall = time.perf_counter() - start
+            runs[workers] = [comparable(result) for result in results]
+            label = f"{workers} parse processes" if workers else "in-thread parsing"
+            print(f"{label:20s} {len(lookups) / wall:8.1f} scrapes/s ({len(lookups)} lookups, {threads} threads)")
+        college_scraper.configure_parse_pool(0)
+
+    if runs[0] != runs[parse_workers]:
+        print("MISMATCH: the parse pool changed the results")
+        return 1
+    print("results identical")
+    return 0
+
+def bench_memory(rows, rounds, max_growth=None):
+    """
+    Scrape the corpus and a generated page with rows roster rows, rounds
+    times over, and watch the process's resident memory. After the first
+    round (imports, pools and caches warming up) it should stay flat.
+    Returns 1 if it grew by more than max_growth MiB.
+    """
+    golden = load_golden()
+    college_scraper.configure_fetch_client(cache=None)
+    mib = 1024 * 1024
+
+    with tempfile.TemporaryDirectory() as directory, corpus_servers(golden) as base_urls:
+        with open(os.path.join(directory, 'swimming-and-diving.html'), 'w', encoding='utf-8') as f:
+            f.write(build_large_page(rows))
+        handler = functools.partial(QuietHandler, directory=directory)
+        server = QuietServer(('127.0.0.1', 0), handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            urls = [urljoin(base_urls[site], expected['start']) for site, expected in golden.items()]
+            urls.append(f"http://127.0.0.1:{server.server_address[1]}/swimming-and-diving.html")
+
+            settled = None
+            for round_number in range(rounds):
+                peaks = []
+                for url in urls:
+                    result = college_scraper.scrape_college_info(url, use_cache=False, diagnostics=True)
+                    peaks.append(result["diagnostics"]["peakRssBytes"] or 0)
+                rss = college_scraper.current_rss() or 0
+                if settled is None:
+                    settled = rss
+                print(f"round {round_number + 1:3d}  peak {max(peaks) / mib:8.1f} MiB  after {rss / mib:8.1f} MiB")
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    growth = (rss - settled) / mib
+    print(f"growth after the first round {growth:.1f} MiB (body limit {college_scraper.MAX_BODY_BYTES / mib:.1f} MiB)")
+    if max_growth is not None and growth > max_growth:
+        print(f"FAIL: resident memory grew by more than {max_growth:.1f} MiB")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the college scraper.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    division = subparsers.add_parser("division", help="guess_division on a large athletics page")
+    division.add_argument("--rows", type=int, default=1000, help="Roster rows in the generated page")
+    division.add_argument("--repeat", type=int, default=3, help="Runs per implementation (best time is reported)")
+
+    parsers = subparsers.add_parser("parsers", help="Parse and extract a large page with every backend")
+    parsers.add_argument("--rows", type=int, default=1000, help="Roster rows in the generated page")
+    parsers.add_argument("--repeat", type=int, default=3, help="Runs per backend (best time is reported)")
+
+    parity = subparsers.add_parser("parity", help="Check that every parser backend extracts identical JSON")
+    parity.add_argument("files", nargs="*", help="HTML files to check (defaults to the corpus team pages and a generated page)")
+
+    corpus = subparsers.add_parser("corpus", help="Replay the recorded corpus offline and score it against golden outputs")
+    corpus.add_argument("--repeat", type=int, default=5, help="Runs over the whole corpus")
+    corpus.add_argument("--min-accuracy", type=float, default=None, help="Fail if overall field accuracy (0-1) is lower")
+    corpus.add_argument("--max-p95", type=float, default=None, help="Fail if end to end p95 latency (ms) is higher")
+
+    bench = subparsers.add_parser("async", help="Check the async API against the sync one on the corpus and compare throughput")
+    bench.add_argument("--repeat", type=int, default=5, help="Runs over the whole corpus for the throughput comparison")
+
+    pipeline = subparsers.add_parser("pipeline", help="Compare in-thread parsing with the parse process pool on the corpus")
+    pipeline.add_argument("--parse-workers", type=int, default=os.cpu_count() or 1, help="Parse processes")
+    pipeline.add_argument("--threads", type=int, default=None, help="Fetching threads (default: enough to fill the pool)")
+    pipeline.add_argument("--repeat", type=int, default=10, help="Runs over the whole corpus")
+
+    memory = subparsers.add_parser("memory", help="Check that resident memory stays flat over repeated scrapes")
+    memory.add_argument("--rows", type=int, default=20000, help="Roster rows in the generated large page")
+    memory.add_argument("--rounds", type=int, default=3, help="Runs over the corpus and the large page")
+    memory.add_argument("--max-growth", type=float, default=None, help="Fail if memory grows by more MiB after the first round")
+
+    args = parser.parse_args()
+
+    if args.command == "division":
+        sys.exit(bench_division(args.rows, args.repeat))
+    elif args.command == "parsers":
+        sys.exit(bench_parsers(args.rows, args.repeat))
+    elif args.command == "parity":
+        sys.exit(check_parity(args.files))
+    elif args.command == "corpus":
+        sys.exit(bench_corpus(args.repeat, args.min_accuracy, args.max_p95))
+    elif args.command == "async":
+        sys.exit(bench_async(args.repeat))
+    elif args.command == "pipeline":
+        sys.exit(bench_pipeline(args.parse_workers, args.threads, args.repeat))
+    elif args.command == "memory":
+        sys.exit(bench_memory(args.rows, args.rounds, args.max_growth))
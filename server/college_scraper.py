@@ -1,10 +1,816 @@
 import trafilatura
 import re
+import os
+import copy
 import json
 import time
-from urllib.parse import urlparse, urljoin
+import hashlib
+import tempfile
+import logging
+import asyncio
+import weakref
+import functools
+import threading
+import contextvars
+from contextlib import contextmanager
+from itertools import islice
+from html.parser import HTMLParser
+from urllib.parse import urlparse, urljoin, urlunparse, parse_qsl, urlencode
+import httpx
 import requests
 from bs4 import BeautifulSoup
+from bs4.filter import ElementFilter
+
+# Structured logs go to stderr so they never mix with the JSON on stdout.
+# Set SCRAPER_LOG_LEVEL=INFO (or pass --log-level) to get one line per scrape.
+logger = logging.getLogger('college_scraper')
+# Library users who haven't configured logging shouldn't get bare 'scrape'
+# lines from logging.lastResort.
+logger.addHandler(logging.NullHandler())
+
+class JsonLogFormatter(logging.Formatter):
+    """Render log records as one JSON object per line."""
+
+    def format(self, record):
+        entry = {"level": record.levelname.lower(), "event": record.getMessage()}
+        entry.update(getattr(record, 'fields', {}))
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry)
+
+def configure_logging(level=None):
+    """Send structured scraper logs to stderr at the given level."""
+    level = level or os.environ.get('SCRAPER_LOG_LEVEL', 'WARNING')
+    if not any(not isinstance(h, logging.NullHandler) for h in logger.handlers):
+        handler = logging.StreamHandler()
+        handler.setFormatter(JsonLogFormatter())
+        logger.addHandler(handler)
+        logger.propagate = False
+    logger.setLevel(level.upper() if isinstance(level, str) else level)
+
+def current_rss():
+    """Resident memory of this process in bytes, or None where it can't be read."""
+    try:
+        with open('/proc/self/statm', 'rb') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    import sys
+    # Without /proc only the all-time peak is known; bytes on macOS, KiB elsewhere
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+class ScrapeTrace:
+    """
+    Everything measured during one scrape: wall time per phase, HTTP
+    traffic, cache hits, which heuristic produced each field, the errors
+    that were swallowed to keep stdout clean, and the peak resident memory
+    seen at the end of each phase.
+    """
+
+    def __init__(self, url):
+        self.url = url
+        self.started = time.perf_counter()
+        self.phases = {}
+        self.requests = 0
+        self.bytes_fetched = 0
+        self.http_cache_hits = 0
+        self.truncated_bodies = 0
+        self.result_cache_hit = False
+        self.sources = {}
+        self.errors = []
+        self.peak_rss = current_rss()
+        # Peak of the parse pool process that extracted the page, if one did
+        self.parse_peak_rss = None
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self.phases[name] = self.phases.get(name, 0) + elapsed
+            self.sample_memory()
+
+    def sample_memory(self):
+        """Raise peak_rss to the current resident memory if it is higher."""
+        rss = current_rss()
+        if rss is not None:
+            with self._lock:
+                self.peak_rss = max(self.peak_rss or 0, rss)
+
+    def record_fetch(self, size, from_cache, truncated=False):
+        with self._lock:
+            if from_cache:
+                self.http_cache_hits += 1
+            else:
+                self.requests += 1
+            if truncated:
+                self.truncated_bodies += 1
+            self.bytes_fetched += size
+
+    def merge(self, phases, sources, errors, peak_rss=None):
+        """Add what a scrape stage measured in another process."""
+        with self._lock:
+            for name, seconds in phases.items():
+                self.phases[name] = self.phases.get(name, 0) + seconds
+            self.sources.update(sources)
+            self.errors.extend(errors)
+            self.parse_peak_rss = peak_rss
+
+    def timings(self):
+        """Phase durations in milliseconds, plus the total so far."""
+        timings = {name: round(seconds * 1000, 2) for name, seconds in self.phases.items()}
+        timings["total"] = round((time.perf_counter() - self.started) * 1000, 2)
+        return timings
+
+    def diagnostics(self):
+        return {
+            "requests": self.requests,
+            "bytesFetched": self.bytes_fetched,
+            "httpCacheHits": self.http_cache_hits,
+            "truncatedBodies": self.truncated_bodies,
+            "resultCacheHit": self.result_cache_hit,
+            "sources": dict(self.sources),
+            "errors": list(self.errors),
+            "peakRssBytes": self.peak_rss,
+            "parsePeakRssBytes": self.parse_peak_rss,
+        }
+
+_current_trace = contextvars.ContextVar('scrape_trace', default=None)
+
+def current_trace():
+    """The trace of the scrape running in this context, or None."""
+    return _current_trace.get()
+
+@contextmanager
+def timed(name):
+    """Time a phase of the current scrape; does nothing outside a scrape."""
+    trace = _current_trace.get()
+    if trace is None:
+        yield
+        return
+    with trace.phase(name):
+        yield
+
+def note_source(field, source):
+    """Remember which heuristic produced a field of the current scrape."""
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.sources[field] = source
+
+def note_fetch(size, from_cache=False, truncated=False):
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.record_fetch(size, from_cache, truncated)
+
+def note_error(where, error):
+    """Record a swallowed exception on the current scrape and log it."""
+    message = f"{where}: {type(error).__name__}: {error}"
+    trace = _current_trace.get()
+    if trace is not None:
+        with trace._lock:
+            trace.errors.append(message)
+    logger.info("swallowed_error", extra={"fields": {"where": where, "error": str(error), "type": type(error).__name__}})
+
+class ScrapeCancelled(Exception):
+    """Raised inside a scrape once its deadline has passed or it was cancelled."""
+
+class Deadline:
+    """
+    The total time budget of one scrape, shared by discovery, fetches and
+    extraction. budget=None means no limit. cancel() stops the scrape at the
+    next checkpoint, from any thread, and interrupts async fetches waiting
+    on the network (see until_cancelled).
+    """
+
+    def __init__(self, budget=None):
+        self.expires = time.monotonic() + budget if budget else None
+        self._cancelled = threading.Event()
+        self._callbacks = []
+        self._lock = threading.Lock()
+
+    def cancel(self):
+        with self._lock:
+            self._cancelled.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback()
+
+    def on_cancel(self, callback):
+        """
+        Call callback, in the cancelling thread, once the scrape is cancelled
+        (right away if it already is). Returns a function that unregisters it.
+        """
+        with self._lock:
+            if not self._cancelled.is_set():
+                self._callbacks.append(callback)
+                return lambda: self._remove_callback(callback)
+        callback()
+        return lambda: None
+
+    def _remove_callback(self, callback):
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+    @property
+    def cancelled(self):
+        return self._cancelled.is_set()
+
+    def remaining(self):
+        """Seconds left, or None without a budget."""
+        if self.cancelled:
+            return 0
+        if self.expires is None:
+            return None
+        return max(0, self.expires - time.monotonic())
+
+    def expired(self, slack=0):
+        """True once no more than slack seconds of the budget are left."""
+        remaining = self.remaining()
+        return remaining is not None and remaining <= slack
+
+    def check(self, slack=0):
+        """
+        Raise ScrapeCancelled if the scrape should stop now.
+
+        Fetches that fail call check(DEADLINE_SLACK): a timeout clamped to
+        the budget fires right around its end, and that failure is the
+        deadline's doing, not the site's.
+        """
+        if self.cancelled:
+            raise ScrapeCancelled("Scrape cancelled")
+        if self.expired(slack):
+            raise ScrapeCancelled("Scrape deadline exceeded")
+
+    def timeout(self, limit):
+        """Clamp a per-request timeout to what is left of the budget."""
+        self.check()
+        remaining = self.remaining()
+        return limit if remaining is None else min(limit, remaining)
+
+    def share(self, fraction, limit):
+        """A slice of the remaining budget for one phase, capped at limit seconds."""
+        remaining = self.remaining()
+        return limit if remaining is None else min(limit, remaining * fraction)
+
+# How close to the end of its budget a failed fetch counts as timed out by it
+DEADLINE_SLACK = 0.05
+
+_current_deadline = contextvars.ContextVar('scrape_deadline', default=None)
+_no_deadline = Deadline()
+
+def current_deadline():
+    """The deadline of the scrape running in this context (unlimited outside one)."""
+    return _current_deadline.get() or _no_deadline
+
+class FetchedPage:
+    """A downloaded page: the body is fetched once and shared by every consumer."""
+
+    def __init__(self, url, status, content, encoding, elapsed, from_cache=False, truncated=False):
+        self.url = url
+        self.status = status
+        self.content = content
+        self.encoding = encoding or 'utf-8'
+        self.size = len(content)
+        self.elapsed = elapsed
+        self.from_cache = from_cache
+        # True when the body was cut off at the client's max_body_bytes
+        self.truncated = truncated
+        self._text = None
+
+    @property
+    def text(self):
+        """The body decoded once and reused by the HTML parser and trafilatura."""
+        if self._text is None:
+            self._text = self.content.decode(self.encoding, errors='replace')
+        return self._text
+
+# On-disk response cache settings. Entries younger than CACHE_TTL seconds are
+# served without touching the network; older ones are revalidated with
+# If-None-Match / If-Modified-Since. Set SCRAPER_CACHE_DIR to "" to disable.
+CACHE_DIR = os.environ.get('SCRAPER_CACHE_DIR', os.path.join(tempfile.gettempdir(), 'ripscore-scraper-cache'))
+CACHE_TTL = 6 * 60 * 60
+CACHE_MAX_BYTES = 200 * 1024 * 1024
+
+def normalize_url(url):
+    """Normalize a URL so equivalent spellings share one cache key."""
+    parsed = urlparse(url.strip())
+    scheme = (parsed.scheme or 'https').lower()
+    host = (parsed.hostname or '').lower()
+    port = parsed.port
+    if port and not ((scheme == 'http' and port == 80) or (scheme == 'https' and port == 443)):
+        host = f"{host}:{port}"
+    path = parsed.path or '/'
+    query = urlencode(sorted(parse_qsl(parsed.query, keep_blank_values=True)))
+    return urlunparse((scheme, host, path, '', query, ''))
+
+def atomic_write(path, data, mode=None):
+    """
+    Write bytes to path through a temporary file in the same directory, so
+    readers never see a partial file. mode, if given, is applied before the
+    file is moved into place. OSError propagates once the temporary file has
+    been cleaned up.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        if mode is not None:
+            os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+class ResponseCache:
+    """
+    Persistent HTTP response cache stored as one metadata/body file pair per URL.
+
+    Access times double as LRU order: reading an entry touches its files, and
+    once the directory grows past max_bytes the least recently used entries
+    are deleted.
+    """
+
+    def __init__(self, directory=CACHE_DIR, ttl=CACHE_TTL, max_bytes=CACHE_MAX_BYTES):
+        self.directory = directory
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def _paths(self, url):
+        key = hashlib.sha256(normalize_url(url).encode('utf-8')).hexdigest()
+        base = os.path.join(self.directory, key)
+        return base + '.json', base + '.body'
+
+    def get(self, url):
+        """Return (metadata, body) for a cached URL, or None."""
+        meta_path, body_path = self._paths(url)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            with open(body_path, 'rb') as f:
+                body = f.read()
+        except (OSError, ValueError):
+            return None
+
+        # Mark as recently used
+        now = time.time()
+        for path in (meta_path, body_path):
+            try:
+                os.utime(path, (now, now))
+            except OSError:
+                pass
+        return meta, body
+
+    def is_fresh(self, meta):
+        """True while an entry is young enough to serve without revalidating."""
+        return time.time() - meta.get('stored_at', 0) < self.ttl
+
+    def store(self, url, page, headers):
+        """Save a successful response along with its validators."""
+        meta = {
+            "url": page.url,
+            "status": page.status,
+            "encoding": page.encoding,
+            "etag": headers.get('ETag'),
+            "last_modified": headers.get('Last-Modified'),
+            "stored_at": time.time(),
+        }
+        meta_path, body_path = self._paths(url)
+        self._write(body_path, page.content)
+        self._write(meta_path, json.dumps(meta).encode('utf-8'))
+        self.prune()
+
+    def refresh(self, url, meta):
+        """Restart an entry's TTL after the server confirmed it is unchanged (304)."""
+        meta = dict(meta, stored_at=time.time())
+        meta_path, _ = self._paths(url)
+        self._write(meta_path, json.dumps(meta).encode('utf-8'))
+        return meta
+
+    def invalidate(self, url):
+        """Drop a single URL from the cache."""
+        for path in self._paths(url):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _write(self, path, data):
+        try:
+            atomic_write(path, data)
+        except OSError:
+            pass
+
+    def prune(self):
+        """Evict least recently used entries until the cache fits in max_bytes."""
+        with self._lock:
+            entries = {}
+            total = 0
+            try:
+                names = os.listdir(self.directory)
+            except OSError:
+                return
+            for name in names:
+                key, ext = os.path.splitext(name)
+                if ext not in ('.json', '.body'):
+                    continue
+                try:
+                    stat = os.stat(os.path.join(self.directory, name))
+                except OSError:
+                    continue
+                size, used = entries.get(key, (0, 0))
+                entries[key] = (size + stat.st_size, max(used, stat.st_mtime))
+                total += stat.st_size
+
+            if total <= self.max_bytes:
+                return
+
+            for key, (size, _) in sorted(entries.items(), key=lambda item: item[1][1]):
+                for ext in ('.json', '.body'):
+                    try:
+                        os.remove(os.path.join(self.directory, key + ext))
+                    except OSError:
+                        pass
+                total -= size
+                if total <= self.max_bytes:
+                    break
+
+def default_response_cache():
+    """Build the default on-disk cache, or None when caching is disabled or unavailable."""
+    if not CACHE_DIR:
+        return None
+    try:
+        return ResponseCache()
+    except OSError:
+        return None
+
+# Shared HTTP client settings
+MAX_CONNECTIONS = 200
+MAX_RETRIES = 2
+RETRY_BACKOFF = 0.3
+MAX_CONNECTIONS_PER_HOST = 2
+# Transient statuses retried with backoff
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+# Largest response body read, counted after decompression. Longer bodies are
+# cut off there and never cached, so one huge or hostile page can't balloon
+# a worker's memory. Set SCRAPER_MAX_BODY_BYTES to 0 for no limit.
+MAX_BODY_BYTES = int(os.environ.get('SCRAPER_MAX_BODY_BYTES', str(5 * 1024 * 1024)))
+
+def supported_encodings():
+    """Content encodings we can decode; brotli only when a decoder is installed."""
+    encodings = ['gzip', 'deflate']
+    try:
+        import brotli  # noqa: F401
+        encodings.append('br')
+    except ImportError:
+        try:
+            import brotlicffi  # noqa: F401
+            encodings.append('br')
+        except ImportError:
+            pass
+    return ', '.join(encodings)
+
+def response_encoding(headers, content):
+    """A body's charset picked the way requests does: the Content-Type header, else a guess."""
+    encoding = requests.utils.get_encoding_from_headers(headers)
+    if encoding is None:
+        from requests.compat import chardet
+        encoding = chardet.detect(content)['encoding'] if chardet is not None else 'utf-8'
+    return encoding
+
+class AsyncFetchClient:
+    """
+    Non-blocking HTTP client behind every fetch in the scraper, built on httpx.
+
+    A single httpx.AsyncClient keeps connections (and TLS sessions) alive per
+    host, negotiates compression, retries transient failures with backoff and
+    caps how many requests run against one host at the same time. When a
+    ResponseCache is given, fresh entries skip the network and stale ones
+    are revalidated with a conditional GET; the cache is read and written on
+    the executor. Bodies are cut off at max_body_bytes. Within a scrape, fetches stop at its deadline, and a
+    cancelled scrape also interrupts a request that is waiting on the
+    network. A client belongs to the event loop it is first used on.
+    """
+
+    def __init__(self, max_connections=MAX_CONNECTIONS, max_retries=MAX_RETRIES,
+                 backoff_factor=RETRY_BACKOFF, max_per_host=MAX_CONNECTIONS_PER_HOST, headers=None, cache=None,
+                 max_body_bytes=MAX_BODY_BYTES):
+        # The headers requests sends, which sites already answer the way we expect
+        session_headers = requests.utils.default_headers()
+        session_headers['Accept-Encoding'] = supported_encodings()
+        if headers:
+            session_headers.update(headers)
+
+        limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+        # Every retry, failed connects included, happens in _get where it can respect the deadline
+        transport = httpx.AsyncHTTPTransport(limits=limits)
+        self.client = httpx.AsyncClient(transport=transport, headers=dict(session_headers), follow_redirects=True)
+
+        self.cache = cache
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_per_host = max_per_host
+        self.max_body_bytes = max_body_bytes
+        self._host_slots = {}
+
+    def host_slot(self, url):
+        """Return the semaphore that caps concurrent requests to the URL's host."""
+        host = urlparse(url).netloc.lower()
+        slot = self._host_slots.get(host)
+        if slot is None:
+            slot = asyncio.Semaphore(self.max_per_host)
+            self._host_slots[host] = slot
+        return slot
+
+    async def fetch(self, url, timeout=10, revalidate=False, max_bytes=None):
+        """
+        Download a URL once, recording response size and timing.
+
+        With revalidate=True a cached copy is always confirmed with a
+        conditional GET, even while it is fresh. Reading stops after
+        max_bytes, or the client's max_body_bytes; the cut off body is
+        returned but never cached.
+        """
+        start = time.perf_counter()
+
+        cached = await run_in_executor(self.cache.get, url) if self.cache else None
+        request_headers = {}
+        if cached:
+            meta, body = cached
+            if self.cache.is_fresh(meta) and not revalidate:
+                note_fetch(len(body), from_cache=True)
+                return self._cached_page(meta, body, start)
+            if meta.get('etag'):
+                request_headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                request_headers['If-Modified-Since'] = meta['last_modified']
+
+        max_bytes = max_bytes or self.max_body_bytes
+
+        async def read(response):
+            if cached and response.status_code == 304:
+                # Counted as a cache hit once the entry is refreshed
+                return b'', False
+            received = []
+            size = 0
+            truncated = False
+            try:
+                # Without a chunk size httpx yields data as it arrives,
+                # so a trickling body still reaches the deadline check
+                async for chunk in response.aiter_bytes():
+                    deadline.check()
+                    if max_bytes and size + len(chunk) > max_bytes:
+                        received.append(chunk[:max_bytes - size])
+                        size = max_bytes
+                        truncated = True
+                        break
+                    received.append(chunk)
+                    size += len(chunk)
+                return b''.join(received), truncated
+            finally:
+                # Also counted when the deadline or a cancel cuts the body short
+                note_fetch(size, truncated=truncated)
+
+        deadline = current_deadline()
+        async with self.host_slot(url):
+            response, (content, truncated) = await until_cancelled(self._get(url, timeout, request_headers, read))
+
+        if cached and response.status_code == 304:
+            note_fetch(len(body), from_cache=True)
+            meta = await run_in_executor(self.cache.refresh, url, meta)
+            return self._cached_page(meta, body, start)
+
+        elapsed = time.perf_counter() - start
+        # Same charset rules as requests, including its ISO-8859-1 default for text/*
+        encoding = response_encoding(response.headers, content)
+        page = FetchedPage(str(response.url), response.status_code, content, encoding, elapsed, truncated=truncated)
+        if self.cache and response.status_code == 200 and not truncated:
+            await run_in_executor(self.cache.store, url, page, response.headers)
+        return page
+
+    async def scan(self, url, consume, timeout=10, max_bytes=None):
+        """
+        Feed a URL's body to consume() as decoded text chunks while it downloads.
+
+        consume is a coroutine function; once it returns True, reading stops
+        and the connection's remaining bytes are dropped, so callers can bail
+        out as soon as they have what they need. The stream also ends at
+        max_bytes, or the client's max_body_bytes. Only fully read 200
+        responses are written to the cache.
+        """
+        import codecs
+
+        cached = await run_in_executor(self.cache.get, url) if self.cache else None
+        if cached and self.cache.is_fresh(cached[0]):
+            meta, body = cached
+            note_fetch(len(body), from_cache=True)
+            await consume(body.decode(meta.get('encoding') or 'utf-8', errors='replace'))
+            return
+
+        max_bytes = max_bytes or self.max_body_bytes
+        received = []
+
+        async def read(response):
+            encoding = requests.utils.get_encoding_from_headers(response.headers) or 'utf-8'
+            decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+            size = 0
+            truncated = False
+            try:
+                # Without a chunk size httpx yields data as it arrives
+                async for chunk in response.aiter_bytes():
+                    deadline.check()
+                    if max_bytes and size + len(chunk) > max_bytes:
+                        chunk = chunk[:max_bytes - size]
+                        truncated = True
+                    received.append(chunk)
+                    size += len(chunk)
+                    if await consume(decoder.decode(chunk)) or truncated:
+                        return encoding, False
+                await consume(decoder.decode(b'', final=True))
+                return encoding, True
+            finally:
+                note_fetch(size, truncated=truncated)
+
+        deadline = current_deadline()
+        async with self.host_slot(url):
+            # Chunks already handed to consume() can't be taken back, so a
+            # failure after the first one is not retried
+            response, (encoding, complete) = await until_cancelled(
+                self._get(url, timeout, {}, read, retry_reads=lambda: not received))
+
+        if self.cache and response.status_code == 200 and complete:
+            page = FetchedPage(str(response.url), response.status_code, b''.join(received), encoding, 0)
+            await run_in_executor(self.cache.store, url, page, response.headers)
+
+    async def _get(self, url, timeout, headers, read, retry_reads=None):
+        """
+        GET a URL with retries; returns (response, what read(response) returned).
+
+        Each attempt only gets what is left of the scrape's budget, and
+        timeouts are not retried in a scrape with a budget. A failure while
+        read() runs is only retried if retry_reads() says so.
+        """
+        deadline = current_deadline()
+        for attempt in range(self.max_retries + 1):
+            if attempt > 1:
+                # urllib3's schedule: the first retry goes at once, later ones back off
+                await asyncio.sleep(self.backoff_factor * 2 ** (attempt - 1))
+            try:
+                attempt_timeout = deadline.timeout(timeout)
+                async with self.client.stream('GET', url, timeout=attempt_timeout, headers=headers) as response:
+                    if response.status_code in RETRY_STATUSES and attempt < self.max_retries:
+                        continue
+                    return response, await read(response)
+            except httpx.TransportError as e:
+                budget_timeout = isinstance(e, httpx.TimeoutException) and deadline.remaining() is not None
+                if (attempt >= self.max_retries or budget_timeout or
+                        (retry_reads is not None and not retry_reads())):
+                    deadline.check(DEADLINE_SLACK)
+                    raise
+
+    async def aclose(self):
+        await self.client.aclose()
+
+    def _cached_page(self, meta, body, start):
+        elapsed = time.perf_counter() - start
+        return FetchedPage(meta['url'], meta['status'], body, meta.get('encoding'), elapsed, from_cache=True)
+
+_fetch_client_lock = threading.Lock()
+# Options every AsyncFetchClient is built from, see configure_fetch_client
+_fetch_client_options = None
+# One AsyncFetchClient per event loop, see get_async_fetch_client
+_async_fetch_clients = weakref.WeakKeyDictionary()
+
+def configure_fetch_client(**options):
+    """
+    Build every fetch client from the given AsyncFetchClient options from now on.
+
+    Each event loop gets a new client on its next fetch and the old ones
+    are closed, so this is meant for startup, before fetches are in flight.
+    """
+    global _fetch_client_options
+    with _fetch_client_lock:
+        _fetch_client_options = dict(options)
+        dropped = list(_async_fetch_clients.items())
+        _async_fetch_clients.clear()
+    # A client's connections belong to its loop, so that loop has to close them
+    for loop, client in dropped:
+        if not loop.is_closed():
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+
+def get_async_fetch_client():
+    """
+    Return the running event loop's fetch client, creating it on first use.
+
+    Every loop's client is built from the same options, see
+    configure_fetch_client; by default they share the on-disk response cache.
+    """
+    global _fetch_client_options
+    loop = asyncio.get_running_loop()
+    with _fetch_client_lock:
+        client = _async_fetch_clients.get(loop)
+        if client is None:
+            if _fetch_client_options is None:
+                _fetch_client_options = {'cache': default_response_cache()}
+            client = AsyncFetchClient(**_fetch_client_options)
+            _async_fetch_clients[loop] = client
+        return client
+
+async def until_cancelled(awaitable):
+    """
+    Await awaitable, stopping it as soon as the current scrape is cancelled.
+
+    Deadline.cancel() may come from any thread (a worker's cancel request);
+    it cancels the awaited task through the loop, and the wait then raises
+    ScrapeCancelled instead of running on to the next checkpoint.
+    """
+    deadline = current_deadline()
+    if deadline is _no_deadline:
+        return await awaitable
+    loop = asyncio.get_running_loop()
+    task = asyncio.ensure_future(awaitable)
+    unregister = deadline.on_cancel(lambda: loop.call_soon_threadsafe(task.cancel))
+    try:
+        return await task
+    except asyncio.CancelledError:
+        # Only our own cancellation becomes ScrapeCancelled; the caller's propagates
+        if deadline.cancelled and not asyncio.current_task().cancelling():
+            raise ScrapeCancelled("Scrape cancelled") from None
+        raise
+    finally:
+        unregister()
+
+async def run_in_executor(func, *args):
+    """Run blocking or CPU-heavy work on the loop's default executor, in the current scrape's context."""
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(None, functools.partial(context.run, func, *args))
+
+async def open_fetch_client():
+    """Create the running loop's fetch client ahead of its first request."""
+    get_async_fetch_client()
+
+async def fetch_page_async(url, timeout=10, revalidate=False, max_bytes=None):
+    """Download a URL without blocking the event loop, within the scrape's deadline."""
+    timeout = current_deadline().timeout(timeout)
+    return await get_async_fetch_client().fetch(url, timeout=timeout, revalidate=revalidate, max_bytes=max_bytes)
+
+async def scan_page_async(url, consume, timeout=10, max_bytes=None):
+    """Stream a URL's decoded text into consume() without blocking, within the scrape's deadline."""
+    timeout = current_deadline().timeout(timeout)
+    await get_async_fetch_client().scan(url, consume, timeout=timeout, max_bytes=max_bytes)
+
+# The blocking entry points run their async versions on one background loop,
+# so callers in any number of threads share its fetch client and connection
+# pool. Its executor does their parsing, extraction and disk I/O.
+SYNC_LOOP_THREADS = 32
+
+_sync_loop = None
+_sync_loop_lock = threading.Lock()
+
+def get_sync_loop():
+    """Return the background event loop behind the blocking API, starting it on first use."""
+    global _sync_loop
+    with _sync_loop_lock:
+        if _sync_loop is None:
+            from concurrent.futures import ThreadPoolExecutor
+
+            loop = asyncio.new_event_loop()
+            loop.set_default_executor(ThreadPoolExecutor(max_workers=SYNC_LOOP_THREADS, thread_name_prefix='scraper'))
+            threading.Thread(target=loop.run_forever, name='scraper-loop', daemon=True).start()
+            _sync_loop = loop
+        return _sync_loop
+
+def run_sync(coroutine):
+    """
+    Run a coroutine on the background loop and block until it is done.
+
+    The task is created in a copy of the caller's context, so it reports to
+    the caller's trace and stops at the caller's deadline.
+    """
+    loop = get_sync_loop()
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        coroutine.close()
+        raise RuntimeError("The blocking scraper API can't be called from its own event loop")
+    return asyncio.run_coroutine_threadsafe(coroutine, loop).result()
 
 def extract_domain(url):
     """Extract the domain from a URL."""
@@ -14,69 +820,423 @@ def extract_domain(url):
         domain = domain[4:]
     return domain
 
-def get_college_name(text, domain, soup=None):
+class PatternSet:
+    """
+    An ordered list of regexes, compiled once, that behaves like trying each
+    pattern in turn with re.findall and keeping the first one that matches.
+
+    Each pattern is searched rather than findall'ed, so scanning stops at
+    the first hit instead of collecting every match in the text, and lower
+    priority patterns are never looked at once a higher one matches.
+    """
+
+    def __init__(self, patterns):
+        self.patterns = [re.compile(pattern) for pattern in patterns]
+
+    def first_match(self, text):
+        """Return (pattern index, match) for the first pattern that matches, or (None, None)."""
+        for index, pattern in enumerate(self.patterns):
+            m = pattern.search(text)
+            if m:
+                return index, m
+        return None, None
+
+    def first(self, text):
+        """The re.findall-style value of the first match, or None."""
+        _, m = self.first_match(text)
+        return findall_value(m) if m else None
+
+    def first_pattern_finditer(self, text):
+        """
+        (pattern index, iterator of match objects) for the first pattern
+        that matches anywhere, or (None, an empty iterator).
+        """
+        index, m = self.first_match(text)
+        if index is None:
+            return None, iter(())
+        return index, self.patterns[index].finditer(text, m.start())
+
+    def first_pattern_matches(self, text, limit=None):
+        """
+        (pattern index, up to limit re.findall-style values) for the first
+        pattern that matches anywhere, or (None, []).
+        """
+        index, matches = self.first_pattern_finditer(text)
+        return index, [findall_value(m) for m in islice(matches, limit)]
+
+def findall_value(m):
+    """What re.findall would have returned for this match."""
+    groups = m.groups()
+    if not groups:
+        return m.group(0)
+    if len(groups) == 1:
+        return groups[0]
+    return groups
+
+# Common patterns for college names, in priority order
+COLLEGE_PATTERNS = PatternSet([
+    r"(University of [A-Z][a-z]+ [A-Z][a-z]+)",
+    r"(University of [A-Z][a-z]+)",
+    r"([A-Z][a-z]+ [A-Z][a-z]+ University)",
+    r"([A-Z][a-z]+ University)",
+    r"([A-Z][a-z]+ College)",
+    r"([A-Z][a-z]+ State University)",
+    r"(College of [A-Z][a-z]+)"
+])
+
+# Coach name patterns, in priority order
+COACH_PATTERNS = PatternSet([
+    r"Head Coach:?\s+([A-Z][a-z]+ [A-Z][a-z]+)",
+    r"Coach:?\s+([A-Z][a-z]+ [A-Z][a-z]+)",
+    r"([A-Z][a-z]+ [A-Z][a-z]+)\s+[-–•]\s+Head Coach",
+    r"([A-Z][a-z]+ [A-Z][a-z]+)\s+[-–•]\s+Coach",
+    r"([A-Z][a-z]+ [A-Z][a-z]+)(?:\s+is|\s+has been)\s+(?:the|a)\s+(?:head\s+)?coach"
+])
+
+# Roster names with years (Fr., So., Jr., Sr.), in priority order
+NAME_PATTERNS = PatternSet([
+    r'([A-Z][a-z]+(?: [A-Z][a-z]+)+)\s+[•·-]\s+(Fr\.|So\.|Jr\.|Sr\.)',
+    r'([A-Z][a-z]+(?: [A-Z][a-z]+)+)\s+[•·-]\s+(Freshman|Sophomore|Junior|Senior)',
+    r'([A-Z][a-z]+(?: [A-Z][a-z]+)+)(?:\s+\|\s+|\s+[•·-]\s+)(?:[A-Z][a-z]+)(?:\s+\|\s+|\s+[•·-]\s+)(Fr\.|So\.|Jr\.|Sr\.)'
+])
+
+# Schedule dates, in priority order
+SCHEDULE_PATTERNS = PatternSet([
+    r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[\.a-z]*\s+(\d{1,2})(?:st|nd|rd|th)?[,\s]+(\d{4})',
+    r'(\d{1,2})[-/](\d{1,2})[-/](\d{2,4})',  # Matches dates like 01/15/2023
+    r'(\d{4})[-/](\d{1,2})[-/](\d{1,2})'     # Matches dates like 2023-01-15
+])
+
+TITLE_SUFFIX_PATTERN = re.compile(r'\s+[-|]\s+.*$')
+PARAGRAPH_BREAK_PATTERN = re.compile(r'\n\s*\n')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+OPPONENT_PATTERN = re.compile(r'(?:vs\.?|against|@)\s+([A-Z][a-z]+(?: [A-Z][a-z]+)*)')
+# "vs. Opponent" / "at Opponent" after a meet date, and where the opponent's name ends
+OPPONENT_KEYWORD_PATTERN = re.compile(r'(?:^|\s)(vs\.?|versus|against|at|@)\s+(\S.*)', re.IGNORECASE)
+OPPONENT_END_PATTERN = re.compile(r'\s+[-\u2013\u2014|]\s+|\s*\(|\s{2,}')
+
+# HTML parser backend for team pages: "html.parser", "lxml" (BeautifulSoup on
+# top of lxml) or "selectolax" (the lexbor engine). The extractors only talk
+# to the Document interface below, so the output does not depend on it.
+PARSER_BACKEND = os.environ.get('SCRAPER_PARSER', 'html.parser')
+PARSER_BACKENDS = ('html.parser', 'lxml', 'selectolax')
+
+# Text inside these tags is not part of get_text() on ordinary elements
+HIDDEN_TEXT_TAGS = {'script', 'style', 'template', 'rt', 'rp'}
+
+# When True the team page is parsed into a partial tree holding only the
+# parts the extractors read (see FocusedPageFilter). This is much smaller on
+# large pages, but guess_division then only sees those parts of the document.
+FOCUSED_PARSE = False
+
+class FocusedPageFilter(ElementFilter):
+    """
+    Parse-time filter that keeps only the subtrees the extractors look at:
+    <head> (title and meta), header/nav, images, tables, and containers whose class
+    or id mentions the coach, staff, roster, schedule or logo.
+    """
+
+    KEEP_TAGS = {'head', 'title', 'meta', 'header', 'nav', 'img', 'table'}
+    KEEP_MARKERS = ('coach', 'staff', 'bio', 'profile', 'roster', 'schedule',
+                    'logo', 'brand', 'navbar', 'header', 'nav', 'menu')
+
+    def allow_tag_creation(self, nsprefix, name, attrs):
+        if name in self.KEEP_TAGS:
+            return True
+        if not attrs:
+            return False
+        marker_text = f"{attrs.get('class', '')} {attrs.get('id', '')}".lower()
+        return any(marker in marker_text for marker in self.KEEP_MARKERS)
+
+    def allow_string_creation(self, string):
+        # Loose text outside any kept subtree is never read by the extractors
+        return False
+
+class SoupNode:
+    """An element of a BeautifulSoup-backed document."""
+
+    def __init__(self, tag):
+        self.tag = tag
+
+    def attr(self, name, default=None):
+        return self.tag.get(name, default)
+
+    def find(self, name):
+        """First descendant element with the given tag name, or None."""
+        found = self.tag.find(name)
+        return SoupNode(found) if found is not None else None
+
+    def select(self, css):
+        return [SoupNode(tag) for tag in self.tag.select(css)]
+
+    def html(self):
+        """The element's markup."""
+        return str(self.tag)
+
+    def text(self, exclude=None):
+        """The element's text, leaving out the subtrees matching the exclude selector."""
+        if not exclude:
+            return self.tag.get_text()
+        skipped = {id(tag) for tag in self.tag.select(exclude)}
+        if not skipped:
+            return self.tag.get_text()
+        parts = []
+        for string in self.tag.strings:
+            parent = string.parent
+            while parent is not self.tag and id(parent) not in skipped:
+                parent = parent.parent
+            if parent is self.tag:
+                parts.append(string)
+        return ''.join(parts)
+
+class SoupDocument(SoupNode):
+    """A page parsed by BeautifulSoup with html.parser or lxml."""
+
+    url = None
+
+    def __init__(self, soup):
+        super().__init__(soup)
+
+    @classmethod
+    def parse(cls, html, features='html.parser', focused=False):
+        parse_only = FocusedPageFilter() if focused else None
+        return cls(BeautifulSoup(html, features, parse_only=parse_only))
+
+    def release(self):
+        """Free the parse tree now; BeautifulSoup's parent links otherwise wait for the cycle collector."""
+        self.tag.decompose()
+
+    def meta_content(self, property_name):
+        meta = self.tag.find('meta', property=property_name)
+        return meta.get('content') if meta else None
+
+    def title(self):
+        title_tag = self.tag.find('title')
+        return title_tag.text if title_tag else None
+
+    def text_blocks(self):
+        """
+        Text nodes grouped the way TextIndex needs them.
+
+        Returns (blocks, hidden): blocks is one list of strings per
+        top-level element, holding the strings get_text() would return with
+        a None wherever script/style/template text interrupts them; hidden
+        maps each of those elements to its own text.
+        """
+        from bs4 import NavigableString, Tag
+
+        blocks = []
+        hidden = {}
+        for top in self.tag.children:
+            if not isinstance(top, Tag):
+                continue
+            interesting = top.interesting_string_types
+            block = []
+            for node in top.descendants:
+                if not isinstance(node, NavigableString):
+                    continue
+                if type(node) in interesting:
+                    block.append(str(node))
+                    continue
+                # Script/style/template text only counts for its own tag
+                container = node.parent
+                while container is not None and type(node) not in container.interesting_string_types:
+                    container = container.parent
+                if container is not None and node:
+                    hidden.setdefault(id(container), []).append(str(node))
+                    block.append(None)
+            blocks.append(block)
+        return blocks, hidden
+
+class LexborNode:
+    """An element of a selectolax (lexbor) document."""
+
+    # lexbor's css() can match the node it is called on; BeautifulSoup only
+    # looks at descendants, so elements skip themselves (the document root
+    # stands in for the BeautifulSoup object and keeps itself)
+    include_self = False
+
+    def __init__(self, node):
+        self.node = node
+
+    def _matches(self, css):
+        for node in self.node.css(css):
+            if self.include_self or node.mem_id != self.node.mem_id:
+                yield node
+
+    def attr(self, name, default=None):
+        attributes = self.node.attributes
+        if name not in attributes:
+            return default
+        # Valueless attributes read as '' like in BeautifulSoup
+        value = attributes[name]
+        return value if value is not None else ''
+
+    def find(self, name):
+        found = next(self._matches(name), None)
+        return LexborNode(found) if found is not None else None
+
+    def select(self, css):
+        return [LexborNode(node) for node in self._matches(css)]
+
+    def html(self):
+        """The element's markup."""
+        return self.node.html or ''
+
+    def text(self, exclude=None):
+        """The element's text, leaving out the subtrees matching the exclude selector."""
+        skipped = {node.mem_id for node in self._matches(exclude)} if exclude else None
+        return ''.join(string for string, _, hidden_in in walk_lexbor_text(self.node, skipped=skipped)
+                       if hidden_in is None)
+
+def walk_lexbor_text(node, hidden_in=None, skipped=None):
+    """
+    Yield (string, parent node, enclosing script/style element or None) under node,
+    leaving out the elements whose mem_id is in skipped.
+    """
+    for child in node.iter(include_text=True):
+        tag = child.tag
+        if tag == '-text':
+            yield child.text_content, node, hidden_in
+        elif tag.startswith('-') or tag.startswith('_'):
+            # Comments, doctypes and other non-element nodes carry no text
+            continue
+        elif not skipped or child.mem_id not in skipped:
+            inner = child if hidden_in is None and tag in HIDDEN_TEXT_TAGS else hidden_in
+            yield from walk_lexbor_text(child, inner, skipped)
+
+class LexborDocument(LexborNode):
+    """A page parsed by selectolax's lexbor engine."""
+
+    url = None
+    include_self = True
+
+    def __init__(self, tree):
+        self.tree = tree
+        super().__init__(tree.root)
+
+    @classmethod
+    def parse(cls, html):
+        try:
+            from selectolax.lexbor import LexborHTMLParser
+        except ImportError:
+            raise ImportError("The selectolax parser backend needs the selectolax package")
+        return cls(LexborHTMLParser(html))
+
+    def release(self):
+        """Drop the parse tree; lexbor frees it as soon as nothing references it."""
+        self.tree = self.node = None
+
+    def meta_content(self, property_name):
+        meta = self.tree.css_first(f'meta[property="{property_name}"]')
+        return meta.attributes.get('content') if meta is not None else None
+
+    def title(self):
+        title_tag = self.tree.css_first('title')
+        return LexborNode(title_tag).text() if title_tag is not None else None
+
+    def text_blocks(self):
+        blocks = []
+        hidden = {}
+        if self.node is None:
+            return blocks, hidden
+        block = []
+        # lexbor always builds a single <html> root; a top-level hidden tag
+        # would be the root itself, so only nested ones go to hidden
+        root_hidden = self.node if self.node.tag in HIDDEN_TEXT_TAGS else None
+        for string, _, hidden_in in walk_lexbor_text(self.node, None):
+            if hidden_in is None or hidden_in is root_hidden:
+                block.append(string)
+            elif string:
+                hidden.setdefault(hidden_in.mem_id, []).append(string)
+                block.append(None)
+        blocks.append(block)
+        return blocks, hidden
+
+    def text(self):
+        return LexborNode.text(self) if self.node is not None else ''
+
+def build_document(html, backend=None, focused=False):
+    """
+    Parse HTML with the configured parser backend.
+
+    focused is honoured by the BeautifulSoup backends only; selectolax always
+    builds the full tree, which is already cheaper than a filtered soup.
+    """
+    backend = backend or PARSER_BACKEND
+    if backend == 'html.parser':
+        return SoupDocument.parse(html, 'html.parser', focused=focused)
+    if backend == 'lxml':
+        return SoupDocument.parse(html, 'lxml', focused=focused)
+    if backend == 'selectolax':
+        return LexborDocument.parse(html)
+    raise ValueError(f"Unknown parser backend: {backend}")
+
+def as_document(doc):
+    """Accept either a Document or a plain BeautifulSoup tree."""
+    if isinstance(doc, BeautifulSoup):
+        return SoupDocument(doc)
+    return doc
+
+def get_college_name(text, domain, doc=None):
     """Extract college name from text and domain."""
-    # First, check for common title elements if soup is provided
-    if soup:
+    # First, check for common title elements if a parsed document is provided
+    if doc:
+        doc = as_document(doc)
         # Check meta tags
-        meta_title = soup.find('meta', property='og:site_name')
-        if meta_title and meta_title.get('content'):
-            return meta_title['content']
+        meta_title = doc.meta_content('og:site_name')
+        if meta_title:
+            note_source('name', 'meta og:site_name')
+            return meta_title
             
         # Check title tag
-        title_tag = soup.find('title')
-        if title_tag and title_tag.text:
+        title_text = doc.title()
+        if title_text:
             # Clean up title
-            title = title_tag.text.strip()
+            title = title_text.strip()
             # Remove common title suffixes like " - Home" or " | Official Website"
-            title = re.sub(r'\s+[-|]\s+.*$', '', title)
+            title = TITLE_SUFFIX_PATTERN.sub('', title)
             # If title is reasonably short, it's likely to be the college name
             if len(title) < 50:
+                note_source('name', 'title tag')
                 return title
     
     # Try to find common patterns for college names
-    college_patterns = [
-        r"(University of [A-Z][a-z]+ [A-Z][a-z]+)",
-        r"(University of [A-Z][a-z]+)",
-        r"([A-Z][a-z]+ [A-Z][a-z]+ University)",
-        r"([A-Z][a-z]+ University)",
-        r"([A-Z][a-z]+ College)",
-        r"([A-Z][a-z]+ State University)",
-        r"(College of [A-Z][a-z]+)"
-    ]
-    
-    for pattern in college_patterns:
-        matches = re.findall(pattern, text)
-        if matches:
-            return matches[0]
+    index, m = COLLEGE_PATTERNS.first_match(text)
+    if m:
+        note_source('name', f'college pattern {index}')
+        return findall_value(m)
     
     # Fallback to domain-based name
     parts = domain.split('.')
     if len(parts) >= 2:
         domain_name = parts[0]
+        note_source('name', 'domain')
         # Convert domain name to title case and replace hyphens with spaces
         return domain_name.replace('-', ' ').title()
     
     return "Unknown College"
 
-def get_college_logo(soup, base_url):
+def get_college_logo(doc, base_url):
     """Try to extract college logo URL from webpage."""
     try:
+        doc = as_document(doc)
         potential_logos = []
         
         # Check for image with 'logo' in the class or id
-        logo_imgs = soup.select('img[class*="logo"], img[id*="logo"], img[alt*="logo"], img[src*="logo"]')
-        potential_logos.extend([img.get('src', '') for img in logo_imgs])
+        logo_imgs = doc.select('img[class*="logo"], img[id*="logo"], img[alt*="logo"], img[src*="logo"]')
+        potential_logos.extend([(img.attr('src', ''), 'logo image') for img in logo_imgs])
         
         # Check header/navbar for logos
-        header_logos = soup.select('header img, .header img, .navbar img, nav img, .brand img, .logo img')
-        potential_logos.extend([img.get('src', '') for img in header_logos])
+        header_logos = doc.select('header img, .header img, .navbar img, nav img, .brand img, .logo img')
+        potential_logos.extend([(img.attr('src', ''), 'header image') for img in header_logos])
         
         # Filter out empty or invalid URLs
-        potential_logos = [logo for logo in potential_logos if logo and not logo.startswith('data:')]
+        potential_logos = [(logo, source) for logo, source in potential_logos if logo and not logo.startswith('data:')]
         
         if potential_logos:
-            logo_url = potential_logos[0]
+            logo_url, source = potential_logos[0]
+            note_source('logo', source)
             # Handle relative URLs
             if logo_url.startswith('/'):
                 logo_url = urljoin(base_url, logo_url)
@@ -87,24 +1247,54 @@ def get_college_logo(soup, base_url):
         return None
     except Exception as e:
         # Don't print error to stdout to avoid interfering with JSON output
+        note_error('get_college_logo', e)
         return None
 
-def guess_division(text, soup=None):
+class TextIndex:
+    """
+    Flattened text of a parsed document built in a single pass.
+
+    text holds what get_text() would return for each top-level element,
+    separated by NUL characters so a phrase can never match across two
+    top-level elements. Script, style and template contents are not part
+    of text; they are kept per element in raw_blocks because get_text() on
+    those tags returns them. Where such contents sit between two visible
+    strings, text gets a NUL as well: the :contains() selectors this
+    replaces read them inline, so "Division <script>x</script>I" never
+    matched there either.
+    """
+
+    SEPARATOR = '\x00'
+
+    def __init__(self, doc):
+        blocks, self.raw_blocks = as_document(doc).text_blocks()
+        self.text = self.SEPARATOR.join(
+            ''.join(self.SEPARATOR if string is None else string for string in block)
+            for block in blocks
+        )
+
+    def contains_any(self, phrases):
+        """True if any phrase occurs in the document text or in a script/style block."""
+        if any(phrase in self.text for phrase in phrases):
+            return True
+        for strings in self.raw_blocks.values():
+            block = ''.join(strings)
+            if any(phrase in block for phrase in phrases):
+                return True
+        return False
+
+def guess_division(text, doc=None):
     """Guess the NCAA division from text."""
-    if soup:
-        # Look for more specific division indicators
-        division_elements = soup.select('*:contains("Division I"), *:contains("Division II"), *:contains("Division III"), *:contains("NCAA I"), *:contains("NCAA II"), *:contains("NCAA III")')
-        
-        for element in division_elements:
-            element_text = element.get_text()
-            if "Division I" in element_text or "NCAA I" in element_text or "NCAA Division I" in element_text:
-                return "Division I"
-            elif "Division II" in element_text or "NCAA II" in element_text or "NCAA Division II" in element_text:
-                return "Division II"
-            elif "Division III" in element_text or "NCAA III" in element_text or "NCAA Division III" in element_text:
-                return "Division III"
+    if doc:
+        # Any element mentioning a division marker counts. Since "Division I"
+        # is a prefix of "Division II"/"III" (and "NCAA I" of "NCAA II"/"III"),
+        # an element-level match always reads as Division I.
+        if TextIndex(doc).contains_any(("Division I", "NCAA I")):
+            note_source('division', 'page element')
+            return "Division I"
     
     # Fallback to text search
+    note_source('division', 'extracted text')
     if "Division I" in text or "NCAA Division I" in text or "NCAA I" in text or "DI" in text:
         return "Division I"
     elif "Division II" in text or "NCAA Division II" in text or "NCAA II" in text or "DII" in text:
@@ -112,28 +1302,27 @@ def guess_division(text, soup=None):
     elif "Division III" in text or "NCAA Division III" in text or "NCAA III" in text or "DIII" in text:
         return "Division III"
     else:
+        note_source('division', 'none')
         return "Unknown"
 
-def extract_coach_info(text, soup=None):
-    """Extract coach information from text and/or soup."""
+# Containers that hold the coach's name, photo and bio
+# Navigation inside a coach section isn't part of the bio. It is skipped
+# when reading the section's text, never removed: the page's tree stays
+# intact for the extractors that run after the coach one.
+SECTION_NAV_SELECTOR = 'nav, .nav, .navigation, .menu'
+COACH_SECTION_SELECTOR = '.coach, .staff, .coaching-staff, #coach, #coaches, *[id*="coach"], *[class*="coach"], .bio, .biography, .profile'
+
+def extract_coach_info(text, doc=None):
+    """Extract coach information from text and/or the parsed page."""
     coach_name = None
     coach_photo = None
     coach_bio = None
     
     # Try to find coach name in the text
-    coach_patterns = [
-        r"Head Coach:?\s+([A-Z][a-z]+ [A-Z][a-z]+)",
-        r"Coach:?\s+([A-Z][a-z]+ [A-Z][a-z]+)",
-        r"([A-Z][a-z]+ [A-Z][a-z]+)\s+[-–•]\s+Head Coach",
-        r"([A-Z][a-z]+ [A-Z][a-z]+)\s+[-–•]\s+Coach",
-        r"([A-Z][a-z]+ [A-Z][a-z]+)(?:\s+is|\s+has been)\s+(?:the|a)\s+(?:head\s+)?coach"
-    ]
-    
-    for pattern in coach_patterns:
-        matches = re.findall(pattern, text)
-        if matches:
-            coach_name = matches[0]
-            break
+    index, m = COACH_PATTERNS.first_match(text)
+    if m:
+        coach_name = findall_value(m)
+        note_source('coachName', f'text coach pattern {index}')
     
     # Try to extract coach bio from the text
     if coach_name:
@@ -144,7 +1333,7 @@ def extract_coach_info(text, soup=None):
         # Find paragraphs mentioning the coach
         bio_sentences = []
         
-        paragraphs = re.split(r'\n\s*\n', text)
+        paragraphs = PARAGRAPH_BREAK_PATTERN.split(text)
         for paragraph in paragraphs:
             if coach_last_name in paragraph and len(paragraph.split()) > 15:
                 bio_sentences.append(paragraph.strip())
@@ -153,269 +1342,656 @@ def extract_coach_info(text, soup=None):
         
         if bio_sentences:
             coach_bio = " ".join(bio_sentences)
+            note_source('coachBio', 'text paragraphs')
     
-    # If soup is provided, try more specific searches
-    if soup:
+    # If a parsed page is provided, try more specific searches
+    if doc:
+        doc = as_document(doc)
         # Look for coach section
-        coach_sections = soup.select('.coach, .staff, .coaching-staff, #coach, #coaches, *[id*="coach"], *[class*="coach"], .bio, .biography, .profile')
+        coach_sections = doc.select(COACH_SECTION_SELECTOR)
         
         for section in coach_sections:
             # Check if we already found a name
             if coach_name:
                 # Try to find an image in the same section
                 img = section.find('img')
-                if img and img.get('src'):
-                    src = img['src']
+                if img and img.attr('src'):
+                    src = img.attr('src')
                     if not src.startswith(('http://', 'https://')):
-                        parsed_url = urlparse(soup.url if hasattr(soup, 'url') else '')
+                        parsed_url = urlparse(doc.url if hasattr(doc, 'url') else '')
                         base_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
                         src = urljoin(base_url, src)
                     coach_photo = src
+                    note_source('coachPhoto', 'coach section image')
                     
                     # If we don't have a bio yet, try to find it in this section
                     if not coach_bio:
                         # Get the text from this section, excluding navigation elements
-                        for nav in section.select('nav, .nav, .navigation, .menu'):
-                            nav.decompose()
-                        section_text = section.get_text().strip()
+                        section_text = section.text(exclude=SECTION_NAV_SELECTOR).strip()
                         if len(section_text.split()) > 20:  # Only use as bio if it's substantial
                             coach_bio = section_text
+                            note_source('coachBio', 'coach section text')
                     
                     break
             else:
                 # Try to find name in this section
-                section_text = section.get_text()
-                for pattern in coach_patterns:
-                    matches = re.findall(pattern, section_text)
-                    if matches:
-                        coach_name = matches[0]
-                        # Look for an image
-                        img = section.find('img')
-                        if img and img.get('src'):
-                            src = img['src']
-                            if not src.startswith(('http://', 'https://')):
-                                parsed_url = urlparse(soup.url if hasattr(soup, 'url') else '')
-                                base_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
-                                src = urljoin(base_url, src)
-                            coach_photo = src
-                        
-                        # Try to extract bio from this section
-                        for nav in section.select('nav, .nav, .navigation, .menu'):
-                            nav.decompose()
-                        clean_section_text = section.get_text().strip()
-                        if len(clean_section_text.split()) > 20:  # Only use as bio if it's substantial
-                            coach_bio = clean_section_text
-                        
-                        break
+                section_text = section.text()
+                index, m = COACH_PATTERNS.first_match(section_text)
+                if m:
+                    coach_name = findall_value(m)
+                    note_source('coachName', f'coach section pattern {index}')
+                    # Look for an image
+                    img = section.find('img')
+                    if img and img.attr('src'):
+                        src = img.attr('src')
+                        if not src.startswith(('http://', 'https://')):
+                            parsed_url = urlparse(doc.url if hasattr(doc, 'url') else '')
+                            base_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
+                            src = urljoin(base_url, src)
+                        coach_photo = src
+                        note_source('coachPhoto', 'coach section image')
+                    
+                    # Try to extract bio from this section
+                    clean_section_text = section.text(exclude=SECTION_NAV_SELECTOR).strip()
+                    if len(clean_section_text.split()) > 20:  # Only use as bio if it's substantial
+                        coach_bio = clean_section_text
+                        note_source('coachBio', 'coach section text')
     
     # Clean up the bio if we found one
     if coach_bio:
         # Remove excessive whitespace
-        coach_bio = re.sub(r'\s+', ' ', coach_bio).strip()
+        coach_bio = WHITESPACE_PATTERN.sub(' ', coach_bio).strip()
         # Limit to a reasonable length
         if len(coach_bio) > 500:
             coach_bio = coach_bio[:497] + "..."
     
     return coach_name, coach_photo, coach_bio
 
-def find_team_info(text, soup=None):
-    """Extract team roster and schedule information."""
-    roster = []
-    schedule = []
-    
-    # Look for potential roster information using pattern matching
-    # Match names with years (Fr., So., Jr., Sr.)
-    name_patterns = [
-        r'([A-Z][a-z]+(?: [A-Z][a-z]+)+)\s+[•·-]\s+(Fr\.|So\.|Jr\.|Sr\.)',
-        r'([A-Z][a-z]+(?: [A-Z][a-z]+)+)\s+[•·-]\s+(Freshman|Sophomore|Junior|Senior)',
-        r'([A-Z][a-z]+(?: [A-Z][a-z]+)+)(?:\s+\|\s+|\s+[•·-]\s+)(?:[A-Z][a-z]+)(?:\s+\|\s+|\s+[•·-]\s+)(Fr\.|So\.|Jr\.|Sr\.)'
-    ]
-    
-    for pattern in name_patterns:
-        roster_matches = re.findall(pattern, text)
-        if roster_matches:
-            for match in roster_matches[:15]:  # Limit to first 15 matches
-                name = match[0]
-                year = match[1]
-                
-                # Standardize year format
-                if year.lower() in ('freshman', 'fr.'):
-                    year = 'Fr.'
-                elif year.lower() in ('sophomore', 'so.'):
-                    year = 'So.'
-                elif year.lower() in ('junior', 'jr.'):
-                    year = 'Jr.'
-                elif year.lower() in ('senior', 'sr.'):
-                    year = 'Sr.'
-                
-                roster.append({
-                    "name": name,
-                    "year": year,
-                    "position": "Diver"  # Default position
-                })
-            
-            # If we found some roster members, stop searching
-            if roster:
-                break
-    
-    # Try to extract roster from HTML if soup is provided
-    if soup and (not roster or len(roster) < 5):
-        # Look for tables or lists that might contain roster
-        roster_elements = soup.select('table.roster, table[class*="roster"], div[class*="roster"], ul[class*="roster"]')
-        
-        if roster_elements:
-            for element in roster_elements:
-                # Extract text from this element
-                element_text = element.get_text()
-                
-                # Apply our patterns again on this specific element
-                for pattern in name_patterns:
-                    element_matches = re.findall(pattern, element_text)
-                    for match in element_matches[:20]:
-                        name = match[0]
-                        year = match[1]
-                        
-                        # Standardize year format
-                        if year.lower() in ('freshman', 'fr.'):
-                            year = 'Fr.'
-                        elif year.lower() in ('sophomore', 'so.'):
-                            year = 'So.'
-                        elif year.lower() in ('junior', 'jr.'):
-                            year = 'Jr.'
-                        elif year.lower() in ('senior', 'sr.'):
-                            year = 'Sr.'
-                        
-                        # Check if this name is already in the roster
-                        if not any(r['name'] == name for r in roster):
-                            roster.append({
-                                "name": name,
-                                "year": year,
-                                "position": "Diver"
-                            })
-    
-    # Look for potential schedule information
-    # This pattern captures dates with month, day, and year
-    schedule_patterns = [
-        r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[\.a-z]*\s+(\d{1,2})(?:st|nd|rd|th)?[,\s]+(\d{4})',
-        r'(\d{1,2})[-/](\d{1,2})[-/](\d{2,4})',  # Matches dates like 01/15/2023
-        r'(\d{4})[-/](\d{1,2})[-/](\d{1,2})'     # Matches dates like 2023-01-15
-    ]
-    
-    for pattern in schedule_patterns:
-        schedule_matches = re.findall(pattern, text)
-        if schedule_matches:
-            for match in schedule_matches[:8]:  # Limit to first 8 matches
-                # Format depends on which pattern matched
-                if len(match) == 3 and match[0] in ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'):
-                    date_str = f"{match[0]} {match[1]}, {match[2]}"
-                elif len(match) == 3 and match[0].isdigit() and match[1].isdigit() and match[2].isdigit():
-                    if len(match[0]) == 4:  # YYYY-MM-DD format
-                        date_str = f"{match[1]}/{match[2]}/{match[0]}"
-                    else:  # MM/DD/YYYY format
-                        date_str = f"{match[0]}/{match[1]}/{match[2]}"
-                else:
-                    continue  # Skip if format doesn't match expectations
-                
-                # Look for opponent near the date
-                date_idx = text.find(match[0])
-                if date_idx >= 0:
-                    context = text[max(0, date_idx-50):date_idx+50]
-                    vs_pattern = r'(?:vs\.?|against|@)\s+([A-Z][a-z]+(?: [A-Z][a-z]+)*)'
-                    opponent_match = re.search(vs_pattern, context)
-                    opponent = opponent_match.group(1) if opponent_match else "TBD"
-                else:
-                    opponent = "TBD"
-                
-                schedule.append({
-                    "date": date_str,
-                    "opponent": opponent,
-                    "location": "TBD"
-                })
-            
-            # If we found some schedule items, stop searching
-            if schedule:
-                break
-    
-    return roster, schedule
+# Table header text -> roster field, after normalize_header
+ROSTER_COLUMNS = {
+    'name': 'name', 'full name': 'name', 'athlete': 'name', 'student-athlete': 'name',
+    'swimmer': 'name', 'diver': 'name', 'player': 'name',
+    'year': 'year', 'yr': 'year', 'class': 'year', 'cl': 'year', 'academic year': 'year',
+    'eligibility': 'year', 'elig': 'year',
+    'hometown': 'hometown', 'home town': 'hometown',
+    'position': 'position', 'pos': 'position', 'event': 'position', 'events': 'position',
+    'specialty': 'position', 'stroke': 'position',
+}
 
-def find_swimming_diving_page(base_url):
-    """Attempt to find the swimming/diving team page from the main college URL."""
-    try:
-        # Start by fetching the base URL
-        response = requests.get(base_url, timeout=8)
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        # Common paths to athletics/sports pages
-        potential_paths = [
-            '/athletics', '/sports', '/varsity-sports', '/athletics/sports',
-            '/athletics/varsity-sports', '/teams', '/varsity-teams'
-        ]
-        
-        # Look for links to athletics section
-        athletics_links = []
-        
-        # Look for links with athletics-related text
-        for a in soup.find_all('a', href=True):
-            a_text = a.get_text().lower()
-            a_href = a['href'].lower()
-            
-            # Check if this is a link to athletics section
-            if ('athletics' in a_text or 'sports' in a_text or 'teams' in a_text or 
-                any(path in a_href for path in potential_paths)):
-                
-                href = a['href']
-                if href.startswith('/'):
-                    href = urljoin(base_url, href)
-                elif not href.startswith(('http://', 'https://')):
-                    href = urljoin(base_url, href)
-                
-                if href not in athletics_links and is_same_domain(base_url, href):
-                    athletics_links.append(href)
-        
-        # If we don't have any links, try constructing them
-        if not athletics_links:
-            for path in potential_paths:
-                athletics_links.append(urljoin(base_url, path))
-        
-        # Now look for swimming/diving links on each athletics page
-        swimming_links = []
-        
-        for athletics_url in athletics_links[:3]:  # Limit to first 3 to avoid too many requests
+# Table header text -> schedule field, after normalize_header
+SCHEDULE_COLUMNS = {
+    'date': 'date', 'dates': 'date',
+    'opponent': 'opponent', 'opponents': 'opponent', 'event': 'opponent', 'meet': 'opponent',
+    'competition': 'opponent',
+    'location': 'location', 'site': 'location', 'venue': 'location', 'where': 'location',
+}
+
+# Text-wide pattern matching is the last resort and the noisiest, so only it is capped
+TEXT_ROSTER_LIMIT = 15
+TEXT_SCHEDULE_LIMIT = 8
+
+MONTH_ABBREVIATIONS = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+
+def normalize_header(text):
+    """Lowercase a column header and drop punctuation and '/ High School'-style suffixes."""
+    header = WHITESPACE_PATTERN.sub(' ', text).strip().lower().rstrip('.:')
+    return header.split('/')[0].strip().rstrip('.')
+
+def clean_text(text):
+    return WHITESPACE_PATTERN.sub(' ', text).strip()
+
+def standard_class_year(year):
+    """Standardize a class year to Fr./So./Jr./Sr. when it is one of those."""
+    lower = year.lower()
+    if lower in ('freshman', 'fr.', 'fr'):
+        return 'Fr.'
+    elif lower in ('sophomore', 'so.', 'so'):
+        return 'So.'
+    elif lower in ('junior', 'jr.', 'jr'):
+        return 'Jr.'
+    elif lower in ('senior', 'sr.', 'sr'):
+        return 'Sr.'
+    return year
+
+def format_schedule_date(match):
+    """Format a SCHEDULE_PATTERNS re.findall tuple, or None if it isn't a usable date."""
+    if len(match) == 3 and match[0] in MONTH_ABBREVIATIONS:
+        return f"{match[0]} {match[1]}, {match[2]}"
+    elif len(match) == 3 and match[0].isdigit() and match[1].isdigit() and match[2].isdigit():
+        if len(match[0]) == 4:  # YYYY-MM-DD format
+            return f"{match[1]}/{match[2]}/{match[0]}"
+        return f"{match[0]}/{match[1]}/{match[2]}"  # MM/DD/YYYY format
+    return None
+
+def split_opponent(text, leading=False):
+    """
+    Read the opponent out of the text that follows a meet date.
+
+    Returns (opponent, location) where location is "Home" after "vs." and
+    "Away" after "at"/"@", or (None, None) when there is no such keyword.
+    With leading=True the keyword must start the text, so an opponent cell
+    like "Texas at Austin" is not split.
+    """
+    line = text.split('\n', 1)[0].strip()
+    m = OPPONENT_KEYWORD_PATTERN.search(line)
+    if not m or (leading and m.start() != 0):
+        return None, None
+    opponent = OPPONENT_END_PATTERN.split(m.group(2), 1)[0].strip(' ,;:-')
+    if not opponent:
+        return None, None
+    return opponent, 'Away' if m.group(1).lower() in ('at', '@') else 'Home'
+
+def map_columns(header_cells, columns):
+    """{field: column index} for the header cells that name a known field."""
+    mapping = {}
+    for position, cell in enumerate(header_cells):
+        field = columns.get(normalize_header(cell))
+        if field and field not in mapping:
+            mapping[field] = position
+    return mapping
+
+def find_table_header(rows):
+    """
+    Find the header among a table's first rows of cell texts; returns (kind,
+    {field: column index}, row index), or None if it isn't a roster or
+    schedule table.
+    """
+    # The header is the first row (of the first few) naming enough known columns
+    for header_index, header in enumerate(rows[:3]):
+        roster_columns = map_columns(header, ROSTER_COLUMNS)
+        schedule_columns = map_columns(header, SCHEDULE_COLUMNS)
+        if 'name' in roster_columns and len(roster_columns) >= 2:
+            return 'roster', roster_columns, header_index
+        if 'date' in schedule_columns and len(schedule_columns) >= 2:
+            return 'schedule', schedule_columns, header_index
+    return None
+
+def read_table(table, roster, schedule, seen_names, seen_meets):
+    """
+    Read a roster or schedule table row by row using its header row.
+
+    Returns the kind of table it was ('roster' or 'schedule'), or None if
+    the headers don't look like either.
+    """
+    rows = [[clean_text(cell.text()) for cell in row.select('th, td')] for row in table.select('tr')]
+    header = find_table_header(rows)
+    if header is None:
+        return None
+    kind, columns, header_index = header
+
+    for cells in rows[header_index + 1:]:
+        def cell(field):
+            position = columns.get(field)
+            return cells[position] if position is not None and position < len(cells) else ''
+
+        if kind == 'roster':
+            name = cell('name')
+            if not name or name in seen_names:
+                continue
+            seen_names.add(name)
+            entry = {
+                "name": name,
+                "year": standard_class_year(cell('year')),
+                "position": cell('position') or "Diver"
+            }
+            if cell('hometown'):
+                entry["hometown"] = cell('hometown')
+            roster.append(entry)
+        else:
+            raw_date = cell('date')
+            if not raw_date:
+                continue
+            date_match = SCHEDULE_PATTERNS.first(raw_date)
+            date = format_schedule_date(date_match) if date_match else None
+            opponent, location = split_opponent(cell('opponent'), leading=True)
+            opponent = opponent or cell('opponent') or "TBD"
+            meet = (date or raw_date, opponent)
+            if meet in seen_meets:
+                continue
+            seen_meets.add(meet)
+            schedule.append({
+                "date": date or raw_date,
+                "opponent": opponent,
+                "location": cell('location') or location or "TBD"
+            })
+    return kind
+
+def read_list_item(text, roster, schedule, seen_names, seen_meets):
+    """Read one <li> as a roster line ("Name - Jr.") or a meet ("Jan 15, 2025 vs. Opponent")."""
+    _, m = NAME_PATTERNS.first_match(text)
+    if m:
+        name = m.group(1)
+        if name not in seen_names:
+            seen_names.add(name)
+            roster.append({
+                "name": name,
+                "year": standard_class_year(m.group(2)),
+                "position": "Diver"
+            })
+        return
+
+    _, m = SCHEDULE_PATTERNS.first_match(text)
+    if not m:
+        return
+    date = format_schedule_date(findall_value(m))
+    # Without an opponent keyword a dated list item is more likely news than a meet
+    opponent, location = split_opponent(text[m.end():])
+    if not date or not opponent or (date, opponent) in seen_meets:
+        return
+    seen_meets.add((date, opponent))
+    schedule.append({
+        "date": date,
+        "opponent": opponent,
+        "location": location
+    })
+
+def find_structured_team_info(doc):
+    """
+    Read the roster and schedule from the page's tables and lists.
+
+    Every <table> and then every <li> is visited once; tables are read
+    through their header row and list items one line at a time. Entries
+    are deduplicated with sets and nothing is capped.
+    """
+    roster = []
+    schedule = []
+    seen_names = set()
+    seen_meets = set()
+    sources = {}
+
+    for kind, container in team_containers(doc):
+        before = (len(roster), len(schedule))
+        if kind == 'table':
+            read_table(container, roster, schedule, seen_names, seen_meets)
+        else:
+            read_list_item(clean_text(container.text()), roster, schedule, seen_names, seen_meets)
+        if len(roster) > before[0]:
+            sources.setdefault('roster', f'roster {kind}')
+        if len(schedule) > before[1]:
+            sources.setdefault('schedule', f'schedule {kind}')
+
+    for field, source in sources.items():
+        note_source(field, source)
+    return roster, schedule
+
+def team_containers(doc):
+    """Yield ('table' or 'list', element) for every innermost table and then every innermost <li>."""
+    for kind, containers in (('table', doc.select('table')), ('list', doc.select('li'))):
+        for container in containers:
+            # Only the innermost containers hold rows; outer ones would repeat them
+            if container.find('table') is not None:
+                continue
+            if kind == 'list' and (container.find('ul') is not None or container.find('ol') is not None):
+                continue
+            yield kind, container
+
+def team_fingerprints(doc):
+    """
+    Fingerprints of the markup the roster and the schedule are read from, as
+    (roster, schedule); None for a section without any.
+
+    Tables are told apart by their header row alone, without reading the
+    rest. A list item counts for the section its line would add to.
+    """
+    markup = {'roster': [], 'schedule': []}
+    for kind, container in team_containers(doc):
+        if kind == 'table':
+            header_rows = container.select('tr')[:3]
+            header = find_table_header([[clean_text(cell.text()) for cell in row.select('th, td')] for row in header_rows])
+            section = header[0] if header else None
+        else:
+            roster, schedule = [], []
+            read_list_item(clean_text(container.text()), roster, schedule, set(), set())
+            section = 'roster' if roster else 'schedule' if schedule else None
+        if section:
+            markup[section].append(container.html())
+    return tuple(fingerprint('\n'.join(markup[section])) if markup[section] else None
+                 for section in ('roster', 'schedule'))
+
+def find_team_info(text, doc=None):
+    """
+    Extract team roster and schedule information.
+
+    Tables and lists on the page are preferred; pattern matching over the
+    page text only fills in whatever they didn't provide.
+    """
+    roster, schedule = [], []
+    if doc:
+        roster, schedule = find_structured_team_info(as_document(doc))
+
+    if not roster:
+        # Look for potential roster information using pattern matching
+        # Match names with years (Fr., So., Jr., Sr.)
+        index, roster_matches = NAME_PATTERNS.first_pattern_matches(text, TEXT_ROSTER_LIMIT)
+        if roster_matches:
+            note_source('roster', f'text name pattern {index}')
+        seen_names = set()
+        for name, year in roster_matches:
+            if name in seen_names:
+                continue
+            seen_names.add(name)
+            roster.append({
+                "name": name,
+                "year": standard_class_year(year),
+                "position": "Diver"  # Default position
+            })
+
+    if not schedule:
+        # Look for potential schedule information
+        # This pattern captures dates with month, day, and year
+        index, matches = SCHEDULE_PATTERNS.first_pattern_finditer(text)
+        if index is not None:
+            note_source('schedule', f'text date pattern {index}')
+        seen_meets = set()
+        for m in islice(matches, TEXT_SCHEDULE_LIMIT):
+            date_str = format_schedule_date(findall_value(m))
+            if not date_str:
+                continue  # Skip if format doesn't match expectations
+
+            # The opponent is read from the rest of the line this date is on
+            opponent, location = split_opponent(text[m.end():])
+            if not opponent:
+                line = text[m.end():].split('\n', 1)[0]
+                opponent_match = OPPONENT_PATTERN.search(line)
+                opponent = opponent_match.group(1) if opponent_match else "TBD"
+            if (date_str, opponent) in seen_meets:
+                continue
+            seen_meets.add((date_str, opponent))
+            schedule.append({
+                "date": date_str,
+                "opponent": opponent,
+                "location": location or "TBD"
+            })
+
+    return roster, schedule
+
+# Common paths to athletics/sports pages
+ATHLETICS_PATHS = [
+    '/athletics', '/sports', '/varsity-sports', '/athletics/sports',
+    '/athletics/varsity-sports', '/teams', '/varsity-teams'
+]
+
+SWIMMING_TERMS = ['swimming', 'diving', 'swim', 'dive', 'aquatics']
+
+# Discovery limits: how many athletics pages to try, how many to fetch at
+# once, and the total time budget for the crawl. Per-host limits are
+# enforced by the shared fetch client.
+MAX_ATHLETICS_PAGES = 3
+DISCOVERY_WORKERS = 3
+DISCOVERY_DEADLINE = 15
+
+# With an overall scrape deadline, discovery may use this share of what is
+# left; the rest is kept for fetching and extracting the team page.
+DISCOVERY_SHARE = 0.6
+
+# How often a discovery waiting on slow fetches checks for cancellation
+CANCEL_POLL_INTERVAL = 0.25
+
+def resolve_link(href, page_url):
+    """Turn a possibly relative href into an absolute URL."""
+    if href.startswith('/'):
+        return urljoin(page_url, href)
+    elif not href.startswith(('http://', 'https://')):
+        return urljoin(page_url, href)
+    return href
+
+class AnchorScanner(HTMLParser):
+    """
+    Incremental <a href> scanner for pages that are still downloading.
+
+    It tracks open tags the way BeautifulSoup's html.parser tree builder
+    does, so each anchor's text is what a.get_text() would return. Anchors
+    come out in document order as soon as they are closed.
+    """
+
+    VOID_TAGS = {
+        'area', 'base', 'basefont', 'bgsound', 'br', 'col', 'command', 'embed',
+        'frame', 'hr', 'image', 'img', 'input', 'isindex', 'keygen', 'link',
+        'menuitem', 'meta', 'nextid', 'param', 'source', 'spacer', 'track', 'wbr'
+    }
+    # Text inside these tags is not part of get_text() on ordinary elements
+    HIDDEN_TEXT_TAGS = {'script', 'style', 'template', 'rt', 'rp'}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.stack = []
+        self.hidden = 0
+        self.pending = []
+        self.ready = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.VOID_TAGS:
+            return
+        anchor = None
+        if tag == 'a':
+            href = dict(attrs).get('href')
+            if href is not None:
+                anchor = [href, [], False]
+                self.pending.append(anchor)
+        self.stack.append((tag, anchor))
+        if tag in self.HIDDEN_TEXT_TAGS:
+            self.hidden += 1
+
+    def handle_startendtag(self, tag, attrs):
+        # Self-closing tags hold no text, so an anchor written as <a/> is empty
+        if tag == 'a':
+            href = dict(attrs).get('href')
+            if href is not None:
+                self.pending.append([href, [], True])
+                self._release()
+
+    def handle_endtag(self, tag):
+        if not any(name == tag for name, _ in self.stack):
+            return
+        # Like BeautifulSoup, closing a tag also closes everything opened inside it
+        while self.stack:
+            name, anchor = self.stack.pop()
+            self._close(name, anchor)
+            if name == tag:
+                break
+        self._release()
+
+    def handle_data(self, data):
+        if self.hidden:
+            return
+        for _, anchor in self.stack:
+            if anchor is not None:
+                anchor[1].append(data)
+
+    def _close(self, name, anchor):
+        if name in self.HIDDEN_TEXT_TAGS:
+            self.hidden -= 1
+        if anchor is not None:
+            anchor[2] = True
+
+    def _release(self):
+        # Keep document order: an anchor waits until every earlier one is closed
+        while self.pending and self.pending[0][2]:
+            href, text, _ = self.pending.pop(0)
+            self.ready.append((href, ''.join(text)))
+
+    def close(self):
+        super().close()
+        while self.stack:
+            self._close(*self.stack.pop())
+        self._release()
+
+def athletics_link(href, text, base_url):
+    """The same-domain URL of an anchor leading to a college's athletics section, or None."""
+    text = text.lower()
+    if ('athletics' in text or 'sports' in text or 'teams' in text or
+        any(path in href.lower() for path in ATHLETICS_PATHS)):
+        url = resolve_link(href, base_url)
+        if is_same_domain(base_url, url):
+            return url
+    return None
+
+def swimming_link(href, text, page_url, base_url):
+    """The same-domain URL of an anchor leading to a swimming/diving page, or None."""
+    text = text.lower()
+    lower_href = href.lower()
+    if any(term in text for term in SWIMMING_TERMS) or any(term in lower_href for term in SWIMMING_TERMS):
+        url = resolve_link(href, page_url)
+        if is_same_domain(base_url, url):
+            return url
+    return None
+
+async def cancel_tasks(tasks):
+    """
+    Cancel tasks and wait until they have unwound.
+
+    A cancelled scan closes its response and gives back its host slot on
+    the way out, so once this returns nothing is left downloading.
+    """
+    for task in tasks:
+        task.cancel()
+    if tasks:
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+async def first_found(where, searches):
+    """
+    Run (name, coroutine) searches at the same time and return (name, result)
+    for the first one, in the given order, that finds something.
+
+    A search only wins once every search before it came up empty, so running
+    them together doesn't change which one answers. Errors are noted and
+    count as nothing found. The other searches are cancelled as soon as the
+    answer is known. Returns (None, None) if nothing was found.
+    """
+    tasks = [(name, asyncio.ensure_future(search)) for name, search in searches]
+    try:
+        for name, task in tasks:
             try:
-                athletics_response = requests.get(athletics_url, timeout=8)
-                athletics_soup = BeautifulSoup(athletics_response.text, 'html.parser')
-                
-                # Look for links to swimming/diving
-                for a in athletics_soup.find_all('a', href=True):
-                    a_text = a.get_text().lower()
-                    a_href = a['href'].lower()
-                    
-                    swimming_terms = ['swimming', 'diving', 'swim', 'dive', 'aquatics']
-                    
-                    if any(term in a_text for term in swimming_terms) or any(term in a_href for term in swimming_terms):
-                        href = a['href']
-                        if href.startswith('/'):
-                            href = urljoin(athletics_url, href)
-                        elif not href.startswith(('http://', 'https://')):
-                            href = urljoin(athletics_url, href)
-                        
-                        if href not in swimming_links and is_same_domain(base_url, href):
-                            swimming_links.append(href)
-                
+                result = await task
+            except Exception as e:
+                # Don't print error to stdout to avoid interfering with JSON output
+                note_error(f'{where} ({name})', e)
+                continue
+            if result:
+                return name, result
+        return None, None
+    finally:
+        await cancel_tasks([task for _, task in tasks])
+
+async def scan_links(url, match, limit, timeout=8):
+    """
+    Stream a page and collect the distinct URLs that match(href, text) returns
+    for its anchors, in document order.
+
+    The download stops as soon as limit links are found. Anchors are parsed
+    on the executor, one chunk at a time.
+    """
+    scanner = AnchorScanner()
+    links = []
+
+    def collect(chunk):
+        if chunk:
+            scanner.feed(chunk)
+        else:
+            scanner.close()
+        anchors, scanner.ready = scanner.ready, []
+        for href, text in anchors:
+            link = match(href, text)
+            if link and link not in links:
+                links.append(link)
+                if len(links) >= limit:
+                    return True
+        return False
+
+    async def consume(chunk):
+        # The decoder's final flush is empty, which also ends the document
+        return await run_in_executor(collect, chunk)
+
+    await scan_page_async(url, consume, timeout=timeout)
+    return links[:limit]
+
+async def scan_athletics_page(athletics_url, base_url, timeout=8):
+    """
+    Stream one athletics page and return its first swimming/diving link, if any.
+
+    The download stops as soon as a matching anchor has been parsed.
+    """
+    return await scan_links(athletics_url, lambda href, text: swimming_link(href, text, athletics_url, base_url),
+                            1, timeout=timeout)
+
+def find_swimming_diving_page(base_url, concurrent=True, deadline=DISCOVERY_DEADLINE):
+    """Blocking version of find_swimming_diving_page_async."""
+    return run_sync(find_swimming_diving_page_async(base_url, concurrent=concurrent, deadline=deadline))
+
+async def find_swimming_diving_page_async(base_url, concurrent=True, deadline=DISCOVERY_DEADLINE):
+    """
+    Attempt to find the swimming/diving team page from the main college URL.
+
+    The homepage is streamed until MAX_ATHLETICS_PAGES athletics links have
+    turned up. With concurrent=True those pages are then scanned as
+    concurrent tasks and the first one that yields a swimming/diving link
+    wins; the rest are cancelled. The whole discovery phase is bounded by
+    deadline seconds.
+    """
+    try:
+        expires = time.monotonic() + deadline
+
+        athletics_links = await scan_links(base_url, lambda href, text: athletics_link(href, text, base_url),
+                                           MAX_ATHLETICS_PAGES, timeout=min(8, deadline))
+        # If we don't have any links, try constructing them
+        if not athletics_links:
+            athletics_links = [urljoin(base_url, path) for path in ATHLETICS_PATHS[:MAX_ATHLETICS_PAGES]]
+
+        if concurrent:
+            return await find_swimming_link_async(athletics_links, base_url, expires)
+
+        # Now look for swimming/diving links on each athletics page
+        for athletics_url in athletics_links:
+            remaining = expires - time.monotonic()
+            if remaining <= 0 or current_deadline().cancelled:
+                break
+            try:
+                swimming_links = await scan_athletics_page(athletics_url, base_url, timeout=min(8, remaining))
                 # If we found swimming links, no need to check more athletics pages
                 if swimming_links:
-                    break
-                    
+                    return swimming_links[0]
             except Exception as e:
                 # Don't print error to stdout to avoid interfering with JSON output
+                note_error('scan_athletics_page', e)
                 continue
-        
-        # Return the first swimming link, or None if none found
-        return swimming_links[0] if swimming_links else None
-    
+
+        return None
+
     except Exception as e:
         # Don't print error to stdout to avoid interfering with JSON output
+        note_error('find_swimming_diving_page', e)
+        return None
+
+async def find_swimming_link_async(athletics_links, base_url, expires):
+    """Scan athletics pages as concurrent tasks and return the first swimming/diving link found."""
+    remaining = expires - time.monotonic()
+    pending = {
+        asyncio.ensure_future(scan_athletics_page(url, base_url, min(8, max(remaining, 0.1))))
+        for url in athletics_links[:DISCOVERY_WORKERS]
+    }
+    queued = athletics_links[DISCOVERY_WORKERS:]
+    deadline = current_deadline()
+    try:
+        while pending:
+            remaining = expires - time.monotonic()
+            if remaining <= 0 or deadline.cancelled:
+                break
+            done, pending = await asyncio.wait(pending, timeout=min(remaining, CANCEL_POLL_INTERVAL),
+                                               return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                try:
+                    swimming_links = task.result()
+                except Exception as e:
+                    # Don't print error to stdout to avoid interfering with JSON output
+                    note_error('scan_athletics_page', e)
+                    swimming_links = None
+                if swimming_links:
+                    return swimming_links[0]
+                if queued:
+                    pending.add(asyncio.ensure_future(scan_athletics_page(queued.pop(0), base_url, min(8, remaining))))
         return None
+    finally:
+        await cancel_tasks(pending)
 
 def is_same_domain(url1, url2):
     """Check if two URLs are from the same domain."""
@@ -423,6 +1999,295 @@ def is_same_domain(url1, url2):
     domain2 = extract_domain(url2)
     return domain1 == domain2 or domain1.endswith('.' + domain2) or domain2.endswith('.' + domain1)
 
+# Known team page URLs on the platforms most athletics sites run on, most
+# common first. Sitemap entries matching one win outright, and the first
+# TEMPLATE_PROBES are tried directly when the sitemap has nothing.
+TEAM_PAGE_TEMPLATES = [
+    '/sports/swimming-and-diving',          # Sidearm, combined program
+    '/sports/mens-swimming-and-diving',     # Sidearm
+    '/sports/womens-swimming-and-diving',   # Sidearm
+    '/sports/swimming',                     # PrestoSports
+    '/sports/mswimdive',                    # PrestoSports
+    '/sports/wswimdive',                    # PrestoSports
+    '/sports/m-swim',                       # CBS Interactive / WMT
+    '/sports/w-swim',                       # CBS Interactive / WMT
+    '/sports/c-swim',                       # CBS Interactive / WMT
+    '/sports/swim-dive',
+    '/athletics/swimming-and-diving',
+]
+TEMPLATE_PROBES = 3
+
+# Sitemaps can list every page of a university; bound how much we read
+MAX_SITEMAPS = 3
+SITEMAP_MAX_BYTES = 5 * 1024 * 1024
+SITEMAP_LOC_PATTERN = re.compile(r'<loc>\s*([^<\s]+)\s*</loc>', re.IGNORECASE)
+
+# Where resolved team pages are remembered between runs ("" disables it)
+TEAM_INDEX_PATH = os.environ.get('SCRAPER_TEAM_INDEX', os.path.join(tempfile.gettempdir(), 'ripscore-team-pages.json'))
+TEAM_INDEX_TTL = 30 * 24 * 60 * 60
+
+def team_index_key(url):
+    """Key the team page index by college host, ignoring scheme and www."""
+    return result_cache_key(url).split('/', 1)[0]
+
+class TeamPageIndex:
+    """
+    Persistent map of college host -> resolved swimming/diving team page,
+    kept in one JSON file so repeat lookups skip discovery entirely.
+
+    Writes merge with what is on disk, so several worker processes can
+    share the file.
+    """
+
+    def __init__(self, path=TEAM_INDEX_PATH, ttl=TEAM_INDEX_TTL):
+        self.path = path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries = self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return entries if isinstance(entries, dict) else {}
+
+    def get(self, key):
+        """The remembered team page URL for a host, or None if unknown or too old."""
+        entry = self._entries.get(key)
+        if not entry or time.time() - entry.get('resolvedAt', 0) >= self.ttl:
+            return None
+        return entry.get('url')
+
+    def put(self, key, url, source):
+        with self._lock:
+            entries = self._load()
+            entries[key] = {"url": url, "source": source, "resolvedAt": time.time()}
+            self._save(entries)
+
+    def forget(self, key):
+        """Drop a host; returns True if it was known."""
+        with self._lock:
+            entries = self._load()
+            found = entries.pop(key, None) is not None
+            if found:
+                self._save(entries)
+            else:
+                self._entries.pop(key, None)
+            return found
+
+    def _save(self, entries):
+        self._entries = entries
+        try:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            atomic_write(self.path, json.dumps(entries).encode('utf-8'))
+        except OSError:
+            pass
+
+def default_team_index():
+    """Build the default team page index, or None when it is disabled."""
+    return TeamPageIndex() if TEAM_INDEX_PATH else None
+
+team_index = default_team_index()
+
+async def sitemap_urls(base_url, timeout=8):
+    """Sitemaps advertised in robots.txt, or the conventional /sitemap.xml."""
+    page = await fetch_page_async(urljoin(base_url, '/robots.txt'), timeout=timeout)
+    return robots_sitemaps(page, base_url)
+
+def robots_sitemaps(page, base_url):
+    """Sitemap URLs listed in a fetched robots.txt, defaulting to /sitemap.xml."""
+    sitemaps = []
+    if page.status == 200:
+        for line in page.text.splitlines():
+            name, _, value = line.partition(':')
+            if name.strip().lower() == 'sitemap' and value.strip():
+                sitemaps.append(urljoin(base_url, value.strip()))
+    return sitemaps or [urljoin(base_url, '/sitemap.xml')]
+
+def team_page_rank(path):
+    """Sort key for candidate team pages: known templates first, then the shallowest path."""
+    path = path.rstrip('/')
+    if path in TEAM_PAGE_TEMPLATES:
+        return (0, TEAM_PAGE_TEMPLATES.index(path), 0)
+    return (1, path.count('/'), len(path))
+
+async def find_team_page_in_sitemaps(base_url, budget):
+    """Look up the swimming/diving page in the college's sitemaps, following sitemap indexes."""
+    expires = time.monotonic() + budget
+    queue = await sitemap_urls(base_url, timeout=min(8, budget))
+    best = None
+    read = 0
+    while queue and read < MAX_SITEMAPS:
+        remaining = expires - time.monotonic()
+        if remaining <= 0:
+            break
+        sitemap_url = queue.pop(0)
+        if sitemap_url.lower().endswith('.gz'):
+            continue
+        read += 1
+
+        found, best = await scan_sitemap_page(sitemap_url, base_url, queue, best, timeout=min(8, remaining))
+        if found:
+            return found
+
+    return best[1] if best else None
+
+async def scan_sitemap_page(sitemap_url, base_url, queue, best=None, timeout=8):
+    """
+    Stream one sitemap through scan_sitemap and return its (url, best).
+
+    Reading stops at a known template match or after SITEMAP_MAX_BYTES,
+    and only a short unmatched tail is kept between chunks.
+    """
+    buffer = ''
+    found = None
+
+    def scan_chunk(chunk):
+        nonlocal buffer, found, best
+        buffer += chunk
+        locs = []
+        end = 0
+        for match in SITEMAP_LOC_PATTERN.finditer(buffer):
+            locs.append(match.group(1).replace('&amp;', '&'))
+            end = match.end()
+        # Keep only the unmatched tail, which may hold the start of the next <loc>
+        buffer = buffer[end:][-4096:]
+        found, best = scan_sitemap(locs, sitemap_url, base_url, queue, best)
+        return found is not None
+
+    async def consume(chunk):
+        return await run_in_executor(scan_chunk, chunk)
+
+    await scan_page_async(sitemap_url, consume, timeout=timeout, max_bytes=SITEMAP_MAX_BYTES)
+    return found, best
+
+def scan_sitemap(locs, sitemap_url, base_url, queue, best=None):
+    """
+    Look through one sitemap's <loc> URLs for the team page.
+
+    Child sitemaps of an index are added to queue. Returns (url, best): url
+    is a known template match, which ends the search, and best the best
+    other candidate so far as (rank, url), or None.
+    """
+    for loc in locs:
+        loc = urljoin(sitemap_url, loc)
+        path = urlparse(loc).path.lower()
+        if path.endswith('.xml'):
+            # A sitemap index; read the children that look like sports listings first
+            if any(term in path for term in ('sport', 'athletic', 'team')):
+                queue.insert(0, loc)
+            else:
+                queue.append(loc)
+            continue
+        if not any(term in path for term in SWIMMING_TERMS) or not is_same_domain(base_url, loc):
+            continue
+        rank = team_page_rank(path)
+        if rank[0] == 0:
+            return loc, best
+        if best is None or rank < best[0]:
+            best = (rank, loc)
+    return None, best
+
+async def probe_team_page_templates(base_url, budget):
+    """
+    Request the most common platform team page URLs on the college's own host
+    and return the fetched page of the first template that exists.
+
+    The probes go one at a time so they hold only one of the host's
+    connection slots while the sitemap search runs next to them.
+    """
+    expires = time.monotonic() + budget
+    for path in TEAM_PAGE_TEMPLATES[:TEMPLATE_PROBES]:
+        remaining = expires - time.monotonic()
+        if remaining <= 0:
+            break
+        page = await fetch_page_async(urljoin(base_url, path), timeout=min(8, remaining))
+        # A redirect back to the homepage means the template doesn't exist here
+        if page.status == 200 and any(term in urlparse(page.url).path.lower() for term in SWIMMING_TERMS):
+            return page
+    return None
+
+def resolve_team_page(base_url, deadline=DISCOVERY_DEADLINE, use_index=True):
+    """Blocking version of resolve_team_page_async."""
+    return run_sync(resolve_team_page_async(base_url, deadline=deadline, use_index=use_index))
+
+async def resolve_team_page_async(base_url, deadline=DISCOVERY_DEADLINE, use_index=True):
+    """
+    Find the swimming/diving team page for a college URL, cheapest source first.
+
+    The persistent team page index is tried first. Otherwise robots.txt/
+    sitemap.xml and a probe of the common platform URL templates are
+    searched at the same time, the sitemap taking precedence, and only when
+    both come up empty does the link crawl of
+    find_swimming_diving_page_async run. A page only counts once it has
+    been fetched successfully: a remembered page that is gone is dropped
+    from the index and searched for again, and only verified pages are
+    remembered. All of it shares deadline seconds.
+    """
+    url, _ = await _resolve_team_page_async(base_url, deadline, use_index)
+    return url
+
+async def fetch_team_page(url):
+    """
+    Fetch a resolved team page; None if the server says it doesn't exist.
+
+    Other failures raise, so a server having a bad moment doesn't get a good
+    index entry dropped.
+    """
+    page = await fetch_page_async(url, timeout=10)
+    if page.status == 200:
+        return page
+    if 400 <= page.status < 500:
+        return None
+    raise ValueError(f"HTTP {page.status}")
+
+async def _resolve_team_page_async(base_url, deadline, use_index):
+    # Returns (url, page): the team page and its fetched copy, so it isn't downloaded twice
+    key = team_index_key(base_url)
+    index = team_index if use_index else None
+    expires = time.monotonic() + deadline
+    if index:
+        url = index.get(key)
+        if url:
+            page = await fetch_team_page(url)
+            if page:
+                note_source('teamPage', 'team index')
+                return url, page
+            # The remembered page is gone; find the team page again
+            note_error('resolve_team_page (team index)', ValueError(f"{url} no longer exists"))
+            await run_in_executor(index.forget, key)
+
+    stages = [
+        lambda budget: [
+            ('sitemap', find_team_page_in_sitemaps(base_url, budget)),
+            ('url template', probe_team_page_templates(base_url, budget)),
+        ],
+        lambda budget: [
+            ('link crawl', find_swimming_diving_page_async(base_url, deadline=budget)),
+        ],
+    ]
+    for searches in stages:
+        remaining = expires - time.monotonic()
+        if remaining <= 0:
+            break
+        source, found = await first_found('resolve_team_page', searches(remaining))
+        if not found:
+            continue
+        # Probes hand back the page they fetched; sitemap entries and links are unverified
+        page = found if isinstance(found, FetchedPage) else await fetch_team_page(found)
+        if page is None:
+            note_error(f'resolve_team_page ({source})', ValueError(f"{found} doesn't exist"))
+            continue
+        url = found if isinstance(found, str) else page.url
+        note_source('teamPage', source)
+        if index:
+            await run_in_executor(index.put, key, url, source)
+        return url, page
+
+    return None, None
+
 def handle_url(url):
     """Validate, clean URL and determine if we need to search for swimming page."""
     # Make sure URL has protocol
@@ -452,96 +2317,1149 @@ def handle_url(url):
     # Default: try using the URL as is
     return url, False
 
-def scrape_college_info(url):
+# Result memoization settings
+RESULT_CACHE_TTL = 60 * 60
+RESULT_CACHE_SIZE = 256
+
+def result_cache_key(url):
+    """Key a lookup by host and path so stanford.edu and https://www.stanford.edu/ match."""
+    url = url.strip()
+    # Schemes are case-insensitive, HTTP://Stanford.edu/ is a full URL too
+    if urlparse(url).scheme.lower() not in ('http', 'https'):
+        url = 'https://' + url
+    parsed = urlparse(normalize_url(url))
+    host = parsed.netloc.lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    key = host + parsed.path.rstrip('/')
+    if parsed.query:
+        key += '?' + parsed.query
+    return key
+
+class ResultCache:
+    """In-memory LRU of finished scrape results with a TTL."""
+
+    def __init__(self, ttl=RESULT_CACHE_TTL, max_entries=RESULT_CACHE_SIZE):
+        from collections import OrderedDict
+
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return a copy of the cached result for key, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, result = entry
+            if time.monotonic() - stored_at >= self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return copy.deepcopy(result)
+
+    def put(self, result, *keys):
+        """Store a result under every given key, evicting the oldest entries if full."""
+        with self._lock:
+            entry = (time.monotonic(), copy.deepcopy(result))
+            self._store(entry, keys)
+
+    def alias(self, key, *new_keys):
+        """Make new_keys share the entry already stored under key."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._store(entry, new_keys)
+
+    def _store(self, entry, keys):
+        for key in keys:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key):
+        """Drop key and every other key that shares its result."""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return False
+            for other in [k for k, v in self._entries.items() if v is entry]:
+                del self._entries[other]
+            return True
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+result_cache = ResultCache()
+
+def invalidate_scrape_result(url):
+    """Forget the memoized result for an input URL or a resolved team URL, and the host's team page."""
+    invalidated = result_cache.invalidate(result_cache_key(url))
+    if team_index and team_index.forget(team_index_key(url)):
+        invalidated = True
+    return invalidated
+
+# Local copies of logos and coach photos, so pages don't hotlink school images.
+# Files are named by a hash of the source image, which dedups across schools.
+ASSET_DIR = os.environ.get('SCRAPER_ASSET_DIR', os.path.join(tempfile.gettempdir(), 'ripscore-scraper-assets'))
+ASSET_URL_PREFIX = os.environ.get('SCRAPER_ASSET_URL', '/scraper-assets/')
+ASSET_THUMBNAIL_SIZE = 256
+ASSET_MAX_BYTES = 10 * 1024 * 1024
+
+# Leading bytes of the raster formats browsers display, and the extension we store them under
+IMAGE_SIGNATURES = [
+    (b'\x89PNG\r\n\x1a\n', '.png'),
+    (b'\xff\xd8\xff', '.jpg'),
+    (b'GIF87a', '.gif'),
+    (b'GIF89a', '.gif'),
+]
+
+def sniff_image(data):
+    """The file extension for raster image bytes, or None if they aren't one we accept."""
+    for signature, extension in IMAGE_SIGNATURES:
+        if data.startswith(signature):
+            return extension
+    if data[:4] == b'RIFF' and data[8:12] == b'WEBP':
+        return '.webp'
+    # SVG is left out on purpose: served from our origin it could run script
+    return None
+
+def can_resize_images():
+    """True when Pillow is installed to make thumbnails."""
+    try:
+        import PIL  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+def make_thumbnail(data, size=ASSET_THUMBNAIL_SIZE):
+    """
+    Shrink an image to fit in size x size and return (bytes, extension).
+
+    Needs Pillow. Raises ValueError if the data isn't a usable image.
+    """
+    from PIL import Image
+
+    if sniff_image(data) is None:
+        raise ValueError("Not a supported image")
+
+    from io import BytesIO
+    try:
+        with Image.open(BytesIO(data)) as image:
+            image.verify()
+        # verify() leaves the image unusable, so open it again to resize
+        with Image.open(BytesIO(data)) as image:
+            image.thumbnail((size, size))
+            output = BytesIO()
+            if image.mode in ('RGBA', 'LA', 'P'):
+                # Keep transparency (logos) as PNG
+                image.save(output, 'PNG', optimize=True)
+                return output.getvalue(), '.png'
+            image.convert('RGB').save(output, 'JPEG', quality=85, optimize=True)
+            return output.getvalue(), '.jpg'
+    except Exception as e:
+        raise ValueError(f"Unreadable image: {e}")
+
+class AssetStore:
+    """Content-addressed directory of thumbnails; identical sources share one file."""
+
+    EXTENSIONS = ('.png', '.jpg')
+
+    def __init__(self, directory=ASSET_DIR, url_prefix=ASSET_URL_PREFIX, size=ASSET_THUMBNAIL_SIZE):
+        self.directory = directory
+        self.url_prefix = url_prefix
+        self.size = size
+        os.makedirs(directory, exist_ok=True)
+
+    def put(self, data):
+        """Store a thumbnail of image bytes and return its asset reference."""
+        key = f"{hashlib.sha256(data).hexdigest()[:32]}-{self.size}"
+        for extension in self.EXTENSIONS:
+            if os.path.exists(os.path.join(self.directory, key + extension)):
+                return self.url_prefix + key + extension
+
+        thumbnail, extension = make_thumbnail(data, self.size)
+        # mkstemp creates owner-only files; assets are served to everyone
+        atomic_write(os.path.join(self.directory, key + extension), thumbnail, mode=0o644)
+        return self.url_prefix + key + extension
+
+_asset_store = None
+_asset_store_lock = threading.Lock()
+
+def get_asset_store():
+    """Return the shared asset store, creating it on first use."""
+    global _asset_store
+    with _asset_store_lock:
+        if _asset_store is None:
+            _asset_store = AssetStore()
+        return _asset_store
+
+def scrape_college_info(url, use_cache=True, diagnostics=False, deadline=None, assets=False):
     """
     Scrape college website and return relevant information.
     
     Args:
         url: The college website URL
+        use_cache: Reuse a memoized result for this college if one is still fresh,
+            and the team page remembered for its host
+        diagnostics: Add "timings" and "diagnostics" blocks to the result
+        deadline: Total time budget in seconds, or a Deadline that can also be cancelled
+        assets: Store thumbnails of the logo and coach photo locally and add
+            "logoAsset"/"coachPhotoAsset" references to the college block
         
     Returns:
-        dict: College information including name, logo, division, and team data
+        dict: College information including name, logo, division, and team data.
+        "cached" is True when the result came from the memoization layer.
+        "partial" is True when the deadline ran out (or the scrape was
+        cancelled) and the result only holds what was found by then.
+
+    This blocks until scrape_college_info_async is done on the shared
+    background loop.
+    """
+    return run_sync(scrape_college_info_async(url, use_cache=use_cache, diagnostics=diagnostics,
+                                              deadline=deadline, assets=assets))
+
+@contextmanager
+def scrape_context(url, deadline=None):
+    """Run one scrape under its own trace and deadline; yields the trace."""
+    if not isinstance(deadline, Deadline):
+        deadline = Deadline(deadline)
+    trace = ScrapeTrace(url)
+    trace_token = _current_trace.set(trace)
+    deadline_token = _current_deadline.set(deadline)
+    try:
+        yield trace
+    finally:
+        _current_deadline.reset(deadline_token)
+        _current_trace.reset(trace_token)
+
+def log_scrape(trace, result):
+    """Emit one structured log line summarizing a finished scrape."""
+    level = logging.INFO if result.get("success") else logging.WARNING
+    if not logger.isEnabledFor(level):
+        return
+    fields = {"url": trace.url, "success": bool(result.get("success")), "timings": trace.timings()}
+    fields.update(trace.diagnostics())
+    if not result.get("success"):
+        fields["error"] = result.get("error")
+    logger.log(level, "scrape", extra={"fields": fields})
+
+# After a page at least this large is extracted, freed heap memory is handed
+# back to the OS (glibc only); otherwise the C library keeps what lxml and
+# the parser used and one big page leaves the worker bloated for good
+TRIM_AFTER_BYTES = 1024 * 1024
+
+_malloc_trim = None
+
+def trim_memory():
+    """Return freed heap memory to the OS where the C library supports it; True if it did."""
+    global _malloc_trim
+    if _malloc_trim is None:
+        try:
+            import ctypes
+            _malloc_trim = ctypes.CDLL('libc.so.6').malloc_trim
+        except (OSError, AttributeError):
+            _malloc_trim = False
+    if not _malloc_trim:
+        return False
+    _malloc_trim(0)
+    return True
+
+def extract_college_info(html, url, backend=None, focused=None, doc=None):
+    """
+    Run every extractor over an already downloaded team page.
+
+    Only one parse tree is alive at a time: trafilatura's own tree is gone
+    before the page is parsed, and the page's tree is released as soon as
+    the extractors are done. A caller that already parsed the page passes
+    it as doc; that tree is used instead and left for the caller to release.
+    """
+    if focused is None:
+        focused = FOCUSED_PARSE
+    owns_doc = doc is None
+
+    # Get the base URL for resolving relative links
+    parsed_url = urlparse(url)
+    base_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
+    
+    # Get domain for fallback information
+    domain = extract_domain(url)
+
+    # Fields keep these defaults if the deadline stops extraction early
+    college_name = college_logo = division = None
+    coach_name = coach_photo = coach_bio = None
+    roster, schedule = [], []
+    partial = False
+
+    deadline = current_deadline()
+    try:
+        # Extract text content for pattern matching
+        deadline.check()
+        with timed('textExtract'):
+            text = trafilatura.extract(html) or ""
+            note_source('text', 'trafilatura')
+        if doc is None:
+            with timed('parse'):
+                doc = build_document(html, backend=backend, focused=focused)
+        if not text:
+            with timed('textExtract'):
+                # Fallback to the parser's text extraction if trafilatura fails
+                text = doc.text()
+                note_source('text', 'document text')
+
+        # Extract college information
+        deadline.check()
+        with timed('collegeName'):
+            college_name = get_college_name(text, domain, doc)
+        deadline.check()
+        with timed('logo'):
+            college_logo = get_college_logo(doc, base_url)
+        deadline.check()
+        with timed('division'):
+            division = guess_division(text, doc)
+        deadline.check()
+        with timed('coach'):
+            coach_name, coach_photo, coach_bio = extract_coach_info(text, doc)
+        deadline.check()
+        with timed('team'):
+            roster, schedule = find_team_info(text, doc)
+    except ScrapeCancelled:
+        # Out of time: return whatever was extracted so far
+        partial = True
+    finally:
+        if doc is not None and owns_doc:
+            doc.release()
+        if len(html) >= TRIM_AFTER_BYTES:
+            trim_memory()
+
+    # Count number of divers
+    num_divers = len(roster)
+    
+    # Construct response
+    response = {
+        "success": True,
+        "college": {
+            "name": college_name,
+            "url": url,
+            "logo": college_logo,
+            "division": division,
+            "coachName": coach_name,
+            "coachPhoto": coach_photo,
+            "coachBio": coach_bio,
+            "numberOfDivers": num_divers
+        },
+        "team": {
+            "roster": roster,
+            "schedule": schedule
+        }
+    }
+    if partial:
+        response["partial"] = True
+    return response
+
+# CPU stage settings. With PARSE_WORKERS above 0, team pages are parsed and
+# extracted in that many worker processes instead of the fetching threads,
+# and at most PARSE_QUEUE_DEPTH pages per process wait for a free one.
+PARSE_WORKERS = int(os.environ.get('SCRAPER_PARSE_WORKERS', '0'))
+PARSE_QUEUE_DEPTH = 2
+
+def extract_in_worker(content, encoding, url, budget, backend, focused):
+    """
+    Parse pool entry point: decode and extract one page under its own trace.
+
+    Returns the result along with the phases, sources, errors and peak
+    memory recorded while extracting, for the calling process to merge into
+    its trace.
+    """
+    with scrape_context(url, budget) as trace:
+        result = extract_college_info(content.decode(encoding, errors='replace'), url, backend=backend, focused=focused)
+    return result, trace.phases, trace.sources, trace.errors, trace.peak_rss
+
+# A small page that goes through every extractor once, see warm_parse_worker
+WARM_UP_PAGE = (
+    '<html><head><title>Swimming & Diving - Example University Athletics</title></head><body>'
+    '<div class="coach"><h3>Head Coach Jane Doe</h3><img src="/coach.jpg"></div>'
+    '<table><tr><th>Name</th><th>Year</th></tr><tr><td>John Smith</td><td>Jr.</td></tr></table>'
+    '<ul><li>Jan 15, 2025 vs. State University</li></ul><p>NCAA Division I</p></body></html>'
+)
+
+def warm_parse_worker(backend, focused):
     """
+    Parse pool initializer: import the parsers and extractors and run them
+    over a tiny page, so the first real page doesn't pay for it.
+    """
+    try:
+        extract_college_info(WARM_UP_PAGE, 'https://example.edu/sports/swimming-and-diving',
+                             backend=backend, focused=focused)
+    except Exception:
+        # Only a head start; a failing initializer would break the whole pool
+        pass
+
+class ParsePool:
+    """
+    Process pool for the CPU-bound half of a scrape.
+
+    Fetching threads hand over the raw page bytes and wait for the result,
+    so tree building, text extraction and the extractors' regex passes run
+    on every core instead of under one GIL. Only workers * queue_depth pages
+    are in flight at once; beyond that extract() blocks the fetching thread,
+    which holds back further fetches until the processes catch up.
+    """
+
+    def __init__(self, workers, queue_depth=PARSE_QUEUE_DEPTH):
+        self.workers = max(1, workers)
+        self._slots = threading.BoundedSemaphore(self.workers * queue_depth)
+        self._executor_lock = threading.Lock()
+        self.executor = self._start()
+
+    def _start(self):
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        # Spawn rather than fork: forking while fetch threads hold locks can deadlock the child
+        executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context('spawn'),
+                                       initializer=warm_parse_worker, initargs=(PARSER_BACKEND, FOCUSED_PARSE))
+        # Processes are otherwise started on demand, one per submitted page;
+        # a task per worker starts (and warms up) all of them right away
+        for _ in range(self.workers):
+            executor.submit(os.getpid)
+        return executor
+
+    def _restart(self, broken):
+        # A crashed worker breaks the whole executor; later scrapes get a fresh one
+        with self._executor_lock:
+            if self.executor is broken:
+                broken.shutdown(wait=False, cancel_futures=True)
+                self.executor = self._start()
+
+    def extract(self, page, url, backend=None, focused=None):
+        """
+        Run extract_college_info for a fetched page in a worker process.
+
+        The extraction gets what is left of the scrape's deadline. Cancelling
+        the scrape stops the wait with ScrapeCancelled, but a page already
+        being parsed finishes in its worker.
+        """
+        from concurrent.futures.process import BrokenProcessPool
+
+        deadline = current_deadline()
+        with timed('parseQueue'):
+            while not self._slots.acquire(timeout=CANCEL_POLL_INTERVAL):
+                deadline.check()
+        try:
+            deadline.check()
+            executor = self.executor
+            future = executor.submit(
+                extract_in_worker, page.content, page.encoding, url, deadline.remaining(),
+                backend or PARSER_BACKEND, FOCUSED_PARSE if focused is None else focused,
+            )
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+
+        while True:
+            try:
+                result, phases, sources, errors, peak_rss = future.result(timeout=CANCEL_POLL_INTERVAL)
+                break
+            except TimeoutError:
+                if deadline.cancelled:
+                    future.cancel()
+                    deadline.check()
+            except BrokenProcessPool:
+                self._restart(executor)
+                raise
+
+        trace = current_trace()
+        if trace is not None:
+            trace.merge(phases, sources, errors, peak_rss)
+        return result
+
+    def shutdown(self):
+        self.executor.shutdown(cancel_futures=True)
+
+_parse_pool = None
+_parse_pool_lock = threading.Lock()
+
+def get_parse_pool():
+    """Return the shared parse pool, or None when pages are parsed in the fetching thread."""
+    global _parse_pool
+    if PARSE_WORKERS <= 0:
+        return None
+    with _parse_pool_lock:
+        if _parse_pool is None:
+            _parse_pool = ParsePool(PARSE_WORKERS)
+        return _parse_pool
+
+def configure_parse_pool(workers):
+    """
+    Use workers parse processes from now on, starting them right away; 0
+    parses in the fetching threads.
+    """
+    global PARSE_WORKERS, _parse_pool
+    with _parse_pool_lock:
+        previous = _parse_pool
+        PARSE_WORKERS = workers
+        _parse_pool = None
+    if previous:
+        previous.shutdown()
+    return get_parse_pool()
+
+async def scrape_college_info_async(url, use_cache=True, diagnostics=False, deadline=None, assets=False):
+    """
+    Scrape a college website from inside an event loop.
+
+    Takes the same arguments and returns the same result as
+    scrape_college_info. Pages are fetched with httpx without blocking the
+    loop; parsing, extraction and disk I/O run on the loop's default
+    executor, so many lookups can share one loop. Cancelling the awaiting
+    task stops the scrape, as does cancelling the deadline.
+    """
+    with scrape_context(url, deadline) as trace:
+        result = await _scrape_college_info_async(url, use_cache)
+        if assets and result.get("success") and not current_deadline().expired():
+            with timed('assets'):
+                await attach_assets_async(result)
+
+    log_scrape(trace, result)
+    if diagnostics:
+        result["timings"] = trace.timings()
+        result["diagnostics"] = trace.diagnostics()
+    return result
+
+async def _scrape_college_info_async(url, use_cache):
+    trace = current_trace()
     try:
-        # Handle the URL
+        input_key = result_cache_key(url)
+        if use_cache:
+            cached = result_cache.get(input_key)
+            if cached:
+                trace.result_cache_hit = True
+                cached["cached"] = True
+                return cached
+
         url, need_search = handle_url(url)
-        
-        # If we need to search for the swimming page
+
+        # Set when the deadline cut discovery short and we settle for the input page
+        discovery_cut_short = False
+        team_page = None
         if need_search:
-            swimming_url = find_swimming_diving_page(url)
+            deadline = current_deadline()
+            budget = deadline.share(DISCOVERY_SHARE, DISCOVERY_DEADLINE)
+            started = time.monotonic()
+            with timed('discovery'):
+                swimming_url, team_page = await _resolve_team_page_async(url, budget, use_cache)
+            discovery_cut_short = (not swimming_url and deadline.remaining() is not None and
+                                   time.monotonic() - started >= budget)
             if swimming_url:
                 url = swimming_url
-                # Don't print to stdout as it interferes with JSON output
-                pass
-            else:
-                # Don't print to stdout as it interferes with JSON output
-                pass
-        
-        # Fetch the page
-        response = requests.get(url, timeout=10)
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        # Get the base URL for resolving relative links
-        parsed_url = urlparse(url)
-        base_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
-        
-        # Extract text content for pattern matching
-        downloaded = trafilatura.fetch_url(url)
-        text = trafilatura.extract(downloaded) or ""
-        if not text and soup:
-            # Fallback to BeautifulSoup text extraction if trafilatura fails
-            text = soup.get_text()
-        
-        # Get domain for fallback information
-        domain = extract_domain(url)
-        
-        # Extract college information
-        college_name = get_college_name(text, domain, soup)
-        college_logo = get_college_logo(soup, base_url)
-        division = guess_division(text, soup)
-        coach_name, coach_photo, coach_bio = extract_coach_info(text, soup)
-        roster, schedule = find_team_info(text, soup)
-        
-        # Count number of divers
-        num_divers = len(roster)
-        
-        # Construct response
-        response = {
-            "success": True,
-            "college": {
-                "name": college_name,
-                "url": url,
-                "logo": college_logo,
-                "division": division,
-                "coachName": coach_name,
-                "coachPhoto": coach_photo,
-                "coachBio": coach_bio,
-                "numberOfDivers": num_divers
-            },
-            "team": {
-                "roster": roster,
-                "schedule": schedule
-            }
-        }
-        
+
+        # A different input may already have resolved to the same team page
+        team_key = result_cache_key(url)
+        if use_cache:
+            cached = result_cache.get(team_key)
+            if cached:
+                trace.result_cache_hit = True
+                result_cache.alias(team_key, input_key)
+                cached["cached"] = True
+                return cached
+
+        response = await scrape_team_page_async(url, team_page)
+        if discovery_cut_short:
+            response["partial"] = True
+        # Partial results are never memoized, the next lookup should finish the job
+        if use_cache and not response.get("partial"):
+            result_cache.put(response, input_key, team_key)
+        response["cached"] = False
         return response
+    except ScrapeCancelled as e:
+        # Nothing was extracted before the budget ran out
+        return {
+            "success": False,
+            "error": str(e),
+            "partial": True
+        }
     except Exception as e:
         # Don't print to stdout as it interferes with JSON output
+        note_error('scrape_college_info', e)
         return {
             "success": False,
             "error": str(e)
         }
 
+async def scrape_team_page_async(url, page=None):
+    """
+    Fetch a team page without blocking and run every extractor over it on the
+    executor. A page discovery already fetched is used as it is. Raises
+    ValueError unless the page came back with status 200.
+    """
+    # Fetch the page once; the same body feeds both the parser and trafilatura
+    if page is None:
+        with timed('fetch'):
+            page = await fetch_page_async(url, timeout=10)
+    # An error page would otherwise be extracted, and memoized, like a team page
+    if page.status != 200:
+        raise ValueError(f"HTTP {page.status}")
+    pool = get_parse_pool()
+    if pool:
+        return await run_in_executor(pool.extract, page, url)
+    html = page.text
+    # Only the decoded text needs to stay alive while the page is parsed
+    del page
+    return await run_in_executor(extract_college_info, html, url)
+
+async def store_image_async(url):
+    """Download an image and return its asset reference; resizing and writing run on the executor."""
+    page = await fetch_page_async(url, timeout=10)
+    if page.status != 200:
+        raise ValueError(f"HTTP {page.status}")
+    if page.truncated or page.size > ASSET_MAX_BYTES:
+        raise ValueError("Image is too large")
+    return await run_in_executor(get_asset_store().put, page.content)
+
+async def attach_assets_async(result):
+    """
+    Add local "logoAsset" and "coachPhotoAsset" references to a scrape result.
+
+    Both images are fetched at the same time. Images that can't be fetched
+    or aren't real images get None and keep their remote URL in
+    "logo"/"coachPhoto", as do all images when Pillow isn't installed.
+    """
+    college = result.get("college") or {}
+    page_url = college.get("url") or ""
+    # Keep the keys in the same order whichever image finishes first
+    college["logoAsset"] = college["coachPhotoAsset"] = None
+    if not can_resize_images():
+        # Storing originals would serve images of up to ASSET_MAX_BYTES as thumbnails
+        note_error('attach_assets', ImportError("Pillow is not installed, images can't be resized"))
+        return result
+
+    async def attach(field):
+        reference = None
+        source = college.get(field)
+        if source:
+            try:
+                reference = await store_image_async(urljoin(page_url, source))
+            except Exception as e:
+                # Don't print error to stdout to avoid interfering with JSON output
+                note_error(f'attach_assets ({field})', e)
+        college[f"{field}Asset"] = reference
+
+    await asyncio.gather(attach("logo"), attach("coachPhoto"))
+    return result
+
+# Deadlines of the worker scrapes that are queued or running, by request id
+_worker_deadlines = {}
+_worker_deadlines_lock = threading.Lock()
+
+def parse_worker_request(line):
+    """Decode one worker request line into a dict, or None if it isn't one."""
+    try:
+        request = json.loads(line)
+    except ValueError:
+        return None
+    return request if isinstance(request, dict) else None
+
+def worker_request_error(request):
+    """Why a decoded worker request can't be run, or None if it can."""
+    # ids and cancel targets key the table of running scrapes
+    for field in ("id", "target"):
+        if isinstance(request.get(field), (list, dict)):
+            return f'"{field}" must be a string or a number'
+    deadline = request.get("deadline")
+    if deadline is not None and (isinstance(deadline, bool) or not isinstance(deadline, (int, float))
+                                 or not 0 < deadline < float('inf')):
+        return '"deadline" must be a positive number of seconds'
+    url = request.get("url")
+    if url is not None and not isinstance(url, str):
+        return '"url" must be a string'
+    return None
+
+def register_worker_scrape(request):
+    """Create and register the deadline of a scrape or refresh request so it can be cancelled by id."""
+    deadline = Deadline(request.get("deadline"))
+    request_id = request.get("id")
+    if request_id is not None:
+        with _worker_deadlines_lock:
+            _worker_deadlines[request_id] = deadline
+    return deadline
+
+def cancel_worker_scrape(request_id):
+    """Cancel a queued or running worker scrape or refresh; returns False if it isn't known."""
+    with _worker_deadlines_lock:
+        deadline = _worker_deadlines.get(request_id)
+    if deadline is None:
+        return False
+    deadline.cancel()
+    return True
+
+# Fingerprints and last results of refreshed team pages, one JSON file per page
+REFRESH_DIR = os.environ.get('SCRAPER_REFRESH_DIR', os.path.join(tempfile.gettempdir(), 'ripscore-scraper-refresh'))
+
+def fingerprint(value):
+    """Short content hash of a string or any JSON-serializable value."""
+    if not isinstance(value, str):
+        value = json.dumps(value, sort_keys=True)
+    return hashlib.sha256(value.encode('utf-8')).hexdigest()[:32]
+
+def coach_fingerprint(doc):
+    """Fingerprint of the page's coach blocks (text and images), or None if it has none."""
+    sections = doc.select(COACH_SECTION_SELECTOR)
+    if not sections:
+        return None
+    parts = []
+    for section in sections:
+        parts.append(section.text())
+        parts.extend(img.attr('src') or '' for img in section.select('img'))
+    return fingerprint('\n'.join(parts))
+
+class RefreshStore:
+    """What the last refresh of each team page saw: page and section fingerprints and the result."""
+
+    def __init__(self, directory=REFRESH_DIR):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, url):
+        key = hashlib.sha256(normalize_url(url).encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, key + '.json')
+
+    def get(self, url):
+        try:
+            with open(self._path(url), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def put(self, url, state):
+        try:
+            atomic_write(self._path(url), json.dumps(state).encode('utf-8'))
+        except OSError:
+            pass
+
+_refresh_store = None
+_refresh_store_lock = threading.Lock()
+
+def get_refresh_store():
+    """Return the shared refresh store, creating it on first use."""
+    global _refresh_store
+    with _refresh_store_lock:
+        if _refresh_store is None:
+            _refresh_store = RefreshStore()
+        return _refresh_store
+
+def diff_entries(before, after, key):
+    """Entries added, removed and changed between two lists, matched on key(entry)."""
+    old = {key(entry): entry for entry in before}
+    new = {key(entry): entry for entry in after}
+    return {
+        "added": [entry for k, entry in new.items() if k not in old],
+        "removed": [entry for k, entry in old.items() if k not in new],
+        "changed": [{"before": old[k], "after": entry} for k, entry in new.items() if k in old and old[k] != entry],
+    }
+
+def refresh_team_page(url, store):
+    """Refresh one team page against its stored state; see refresh_college_info."""
+    state = store.get(url)
+    previous = state["result"] if state else None
+
+    # Revalidate instead of trusting the response cache TTL: the point is to see changes
+    with timed('fetch'):
+        page = run_sync(fetch_page_async(url, timeout=10, revalidate=True))
+    if page.status != 200:
+        return {"success": False, "url": url, "error": f"HTTP {page.status}"}
+
+    page_fingerprint = hashlib.sha256(page.content).hexdigest()[:32]
+    if state and state.get("page") == page_fingerprint:
+        # Byte-for-byte the same page: nothing to parse or extract
+        note_source('refresh', 'page unchanged')
+        sections = dict.fromkeys(("page", "coach", "roster", "schedule"), "unchanged")
+        return {"success": True, "url": url, "changed": False, "sections": sections, "diff": {}}
+
+    html = page.text
+    with timed('parse'):
+        doc = build_document(html)
+    try:
+        coach = coach_fingerprint(doc)
+        roster_markup, schedule_markup = team_fingerprints(doc)
+        if previous is None:
+            # First refresh of this page: a full extraction of the same tree is the baseline
+            result = extract_college_info(html, url, doc=doc)
+            statuses = dict.fromkeys(("coach", "roster", "schedule"), "new")
+        else:
+            result = copy.deepcopy(previous)
+            college = result["college"]
+            statuses = {}
+            text = None
+
+            def page_text():
+                nonlocal text
+                if text is None:
+                    with timed('textExtract'):
+                        text = trafilatura.extract(html) or doc.text()
+                return text
+
+            if coach is None or coach != state["sections"].get("coach"):
+                with timed('coach'):
+                    coach_info = extract_coach_info(page_text(), doc)
+                college["coachName"], college["coachPhoto"], college["coachBio"] = coach_info
+            # Sections with no tables or lists to fingerprint come from the text
+            # and are always read again
+            if (roster_markup is None or roster_markup != state["sections"].get("roster") or
+                    schedule_markup is None or schedule_markup != state["sections"].get("schedule")):
+                # Tables and lists are read without the text extraction, which is
+                # only paid for when a section has to fall back to it
+                with timed('team'):
+                    roster, schedule = find_structured_team_info(doc)
+                if not roster or not schedule:
+                    text_roster, text_schedule = find_team_info(page_text())
+                    roster = roster or text_roster
+                    schedule = schedule or text_schedule
+                result["team"] = {"roster": roster, "schedule": schedule}
+                college["numberOfDivers"] = len(roster)
+    finally:
+        doc.release()
+        if len(html) >= TRIM_AFTER_BYTES:
+            trim_memory()
+
+    sections = {
+        "coach": coach,
+        "roster": roster_markup or fingerprint(result["team"]["roster"]),
+        "schedule": schedule_markup or fingerprint(result["team"]["schedule"]),
+    }
+    if state:
+        for name, value in sections.items():
+            statuses[name] = "unchanged" if value is not None and value == state["sections"].get(name) else "changed"
+    store.put(url, {"page": page_fingerprint, "sections": sections, "result": result})
+
+    before_college = previous["college"] if previous else {}
+    before_team = previous["team"] if previous else {"roster": [], "schedule": []}
+    diff = {
+        "coach": {
+            field: {"before": before_college.get(field), "after": result["college"].get(field)}
+            for field in ("coachName", "coachPhoto", "coachBio")
+            if before_college.get(field) != result["college"].get(field)
+        },
+        "roster": diff_entries(before_team["roster"], result["team"]["roster"], key=lambda entry: entry["name"]),
+        "schedule": diff_entries(before_team["schedule"], result["team"]["schedule"],
+                                 key=lambda entry: (entry["date"], entry["opponent"])),
+    }
+    changed = bool(diff["coach"]) or any(any(lists.values()) for name, lists in diff.items() if name != "coach")
+    if changed:
+        # The memoized full result is stale now
+        invalidate_scrape_result(url)
+    return {
+        "success": True,
+        "url": url,
+        "changed": changed,
+        "sections": dict(statuses, page="changed"),
+        "diff": diff,
+    }
+
+def refresh_college_info(url, store=None, deadline=None):
+    """
+    Re-check a team's page and report only what changed since the last refresh.
+
+    Each refresh stores a fingerprint of the page bytes, of the coach block
+    and of the tables and lists the roster and schedule are read from. An
+    unchanged page (usually a 304 to a conditional GET) is not parsed at
+    all. A changed page is parsed once, but the coach extractor only runs
+    when its block changed and the roster and schedule are only read again
+    when their markup changed or they come from the page text.
+
+    Returns {"success", "url", "changed", "sections", "diff"}: sections maps
+    page/coach/roster/schedule to "unchanged", "changed" or "new", and diff
+    holds coach field changes and added/removed/changed roster and
+    schedule entries.
+    """
+    store = store or get_refresh_store()
+    with scrape_context(url, deadline) as trace:
+        try:
+            team_url, need_search = handle_url(url)
+            if need_search:
+                team_url = resolve_team_page(team_url) or team_url
+            result = refresh_team_page(team_url, store)
+        except ScrapeCancelled as e:
+            result = {"success": False, "error": str(e), "partial": True}
+        except Exception as e:
+            # Don't print to stdout as it interferes with JSON output
+            note_error('refresh_college_info', e)
+            result = {"success": False, "error": str(e)}
+    log_scrape(trace, result)
+    return result
+
+def handle_worker_request(line, deadline=None):
+    """
+    Run one newline-delimited JSON worker request and return the response dict.
+
+    Scrape requests may carry "deadline" (seconds). {"action": "refresh",
+    "url": ...} runs refresh_college_info instead of a full scrape, with the
+    same deadline rules. {"action": "cancel", "target": id} stops the scrape
+    or refresh with that request id, which then answers with a partial
+    result.
+    """
+    request = parse_worker_request(line)
+    if request is None:
+        return {"id": None, "success": False, "error": "Invalid JSON request"}
+
+    request_id = request.get("id")
+    error = worker_request_error(request)
+    if error:
+        return {"id": request_id, "success": False, "error": error}
+    if request.get("action") == "cancel":
+        return {"id": request_id, "success": True, "cancelled": cancel_worker_scrape(request.get("target"))}
+
+    url = request.get("url")
+    if not url:
+        return {"id": request_id, "success": False, "error": "URL is required"}
+
+    if request.get("action") == "invalidate":
+        return {"id": request_id, "success": True, "invalidated": invalidate_scrape_result(url)}
+
+    if deadline is None:
+        deadline = register_worker_scrape(request)
+    try:
+        if request.get("action") == "refresh":
+            result = refresh_college_info(url, deadline=deadline)
+        else:
+            result = scrape_college_info(url, diagnostics=bool(request.get("diagnostics")), deadline=deadline,
+                                         assets=bool(request.get("assets")))
+    finally:
+        with _worker_deadlines_lock:
+            if _worker_deadlines.get(request_id) is deadline:
+                del _worker_deadlines[request_id]
+    return dict({"id": request_id}, **result)
+
+def serve(input_stream=None, output_stream=None, workers=4):
+    """
+    Run as a long-lived worker reading one JSON request per line.
+
+    Each input line looks like {"id": "...", "url": "..."} and produces exactly
+    one JSON line on the output carrying the same id, with "success": false
+    and an "error" if the request could not be handled. Requests are processed
+    concurrently, so responses may come back in a different order than they
+    were sent. The imported modules stay warm between requests.
+    """
+    import sys
+    from concurrent.futures import ThreadPoolExecutor
+
+    input_stream = input_stream or sys.stdin
+    output_stream = output_stream or sys.stdout
+    write_lock = threading.Lock()
+
+    def respond(line, deadline=None):
+        try:
+            payload = json.dumps(handle_worker_request(line, deadline))
+        except Exception as e:
+            # Every request gets its line back; a request that dies here would
+            # otherwise leave the caller waiting forever
+            logger.error("worker_request_failed", exc_info=True, extra={"fields": {"error": str(e)}})
+            request = parse_worker_request(line) or {}
+            payload = json.dumps({"id": request.get("id"), "success": False, "error": str(e)})
+        with write_lock:
+            output_stream.write(payload + "\n")
+            output_stream.flush()
+
+    # Building the fetch client's TLS context takes a while; do it before the
+    # first request is waiting on it, like the parse pool warms up its workers
+    run_sync(open_fetch_client())
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        for line in input_stream:
+            line = line.strip()
+            if not line:
+                continue
+            request = parse_worker_request(line) or {}
+            if request.get("action") == "cancel" or worker_request_error(request):
+                # Answer cancels, and requests that can't run, right away instead
+                # of queueing them behind the scrapes they target
+                respond(line)
+                continue
+            # Register scrapes and refreshes as they arrive so a cancel also reaches queued ones
+            runs_scrape = request.get("url") and request.get("action") != "invalidate"
+            deadline = register_worker_scrape(request) if runs_scrape else None
+            executor.submit(respond, line, deadline)
+
+# Batch defaults: concurrent scrapes overall and against a single school
+BATCH_WORKERS = 8
+BATCH_PER_HOST = 2
+
+def batch_host(url):
+    """The host a batch lookup will hit first, used for per-host limits."""
+    return result_cache_key(url).split('/', 1)[0]
+
+def load_checkpoint(path):
+    """URLs already finished by an earlier run of the same batch."""
+    done = set()
+    if not path or not os.path.exists(path):
+        return done
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                done.add(line)
+    return done
+
+def batch(urls, output_stream=None, workers=BATCH_WORKERS, per_host=BATCH_PER_HOST, checkpoint=None,
+          diagnostics=False, deadline=None, assets=False, refresh=False):
+    """
+    Scrape many colleges, writing one JSON line per URL as each one finishes.
+
+    urls may be any iterable (a file or stdin works) and is read lazily. At
+    most workers lookups run at once, and at most per_host of them against
+    the same school. With a checkpoint path, every successfully scraped URL
+    is appended to that file and skipped when the batch is run again, so a
+    crashed run resumes where it stopped and failed lookups are retried.
+    deadline and assets apply to every lookup, as in scrape_college_info.
+    With refresh=True every URL is run through refresh_college_info, for a
+    nightly sync of known teams. Team pages are parsed in the parse pool
+    when one is configured, see configure_parse_pool.
+    """
+    import sys
+    from collections import deque, Counter
+    from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+    output_stream = output_stream or sys.stdout
+    workers = max(1, workers)
+    per_host = max(1, per_host)
+    done = load_checkpoint(checkpoint)
+    checkpoint_file = open(checkpoint, 'a', encoding='utf-8') if checkpoint else None
+
+    source = (url.strip() for url in urls)
+    source = (url for url in source if url and not url.startswith('#') and url not in done)
+    exhausted = False
+    queued = deque()
+    running = {}
+    active_hosts = Counter()
+    # How far ahead of the running set we read, to find work for idle hosts
+    lookahead = workers * 4
+
+    def start_ready(executor):
+        # Start queued URLs, oldest first, whose host still has a free slot
+        for _ in range(len(queued)):
+            if len(running) >= workers:
+                return
+            url = queued.popleft()
+            host = batch_host(url)
+            if active_hosts[host] >= per_host:
+                queued.append(url)
+                continue
+            active_hosts[host] += 1
+            if refresh:
+                future = executor.submit(refresh_college_info, url, deadline=deadline)
+            else:
+                future = executor.submit(scrape_college_info, url, diagnostics=diagnostics, deadline=deadline, assets=assets)
+            running[future] = (url, host)
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            while True:
+                while not exhausted and len(queued) < lookahead:
+                    url = next(source, None)
+                    if url is None:
+                        exhausted = True
+                    else:
+                        queued.append(url)
+
+                start_ready(executor)
+                if not running:
+                    if exhausted and not queued:
+                        break
+                    continue
+
+                finished, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in finished:
+                    url, host = running.pop(future)
+                    active_hosts[host] -= 1
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        result = {"success": False, "error": str(e)}
+                    output_stream.write(json.dumps(dict({"input": url}, **result)) + "\n")
+                    output_stream.flush()
+                    # Failed and partial results stay out of the checkpoint so a rerun retries them
+                    if checkpoint_file and result.get("success") and not result.get("partial"):
+                        checkpoint_file.write(url + "\n")
+                        checkpoint_file.flush()
+    finally:
+        if checkpoint_file:
+            checkpoint_file.close()
+
 # Command line usage
 if __name__ == "__main__":
-    import sys
-    
-    if len(sys.argv) > 1:
-        url = sys.argv[1]
-        result = scrape_college_info(url)
-        print(json.dumps(result, indent=2))
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Scrape college swimming and diving team information.")
+    parser.add_argument("url", nargs="?", default="stanford.edu",
+                        help="College or team URL (defaults to stanford.edu to test auto-discovery)")
+    parser.add_argument("--serve", action="store_true",
+                        help="Run as a worker reading JSON requests from stdin, one per line")
+    parser.add_argument("--batch", metavar="FILE",
+                        help="Scrape every URL in FILE (one per line, '-' for stdin) and print NDJSON results")
+    parser.add_argument("--checkpoint", metavar="FILE",
+                        help="Record successful batch URLs in FILE and skip them when resuming")
+    parser.add_argument("--per-host", type=int, default=BATCH_PER_HOST,
+                        help="Maximum concurrent batch scrapes against one school")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Number of concurrent scrapes in worker or batch mode")
+    parser.add_argument("--parse-workers", type=int, default=PARSE_WORKERS,
+                        help="Processes that parse and extract team pages; 0 parses in the fetching threads "
+                             "(default: $SCRAPER_PARSE_WORKERS or 0)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Bypass the on-disk HTTP response cache")
+    parser.add_argument("--focused-parse", action="store_true",
+                        help="Parse only the parts of the team page the extractors read")
+    parser.add_argument("--parser", choices=PARSER_BACKENDS, default=PARSER_BACKEND,
+                        help="HTML parser backend for team pages")
+    parser.add_argument("--diagnostics", action="store_true",
+                        help="Include per-phase timings and diagnostics in the JSON output")
+    parser.add_argument("--deadline", type=float, default=None,
+                        help="Total time budget per scrape in seconds; returns a partial result when it runs out")
+    parser.add_argument("--assets", action="store_true",
+                        help="Store local thumbnails of the logo and coach photo (needs Pillow)")
+    parser.add_argument("--refresh", action="store_true",
+                        help="Re-check known team pages and print only what changed since the last refresh")
+    parser.add_argument("--log-level", default=None,
+                        help="Level for structured logs on stderr (default: $SCRAPER_LOG_LEVEL or WARNING)")
+    args = parser.parse_args()
+
+    configure_logging(args.log_level)
+
+    PARSER_BACKEND = args.parser
+
+    if args.focused_parse:
+        FOCUSED_PARSE = True
+
+    if args.no_cache:
+        configure_fetch_client(cache=None)
+
+    configure_parse_pool(args.parse_workers)
+    # Enough fetching threads to keep every parse process busy
+    pipeline_depth = args.parse_workers * PARSE_QUEUE_DEPTH
+
+    if args.serve:
+        serve(workers=args.workers or max(4, pipeline_depth))
+    elif args.batch:
+        import sys
+
+        workers = args.workers or max(BATCH_WORKERS, pipeline_depth)
+        if args.batch == '-':
+            batch(sys.stdin, workers=workers, per_host=args.per_host, checkpoint=args.checkpoint,
+                  diagnostics=args.diagnostics, deadline=args.deadline, assets=args.assets,
+                  refresh=args.refresh)
+        else:
+            with open(args.batch, 'r', encoding='utf-8') as f:
+                batch(f, workers=workers, per_host=args.per_host, checkpoint=args.checkpoint,
+                      diagnostics=args.diagnostics, deadline=args.deadline, assets=args.assets,
+                      refresh=args.refresh)
     else:
-        # Test with a default URL if none provided
-        test_url = "stanford.edu"  # Just the domain to test auto-discovery
-        result = scrape_college_info(test_url)
-        print(json.dumps(result, indent=2))
\ No newline at end of file
+        if args.refresh:
+            result = refresh_college_info(args.url, deadline=args.deadline)
+        else:
+            result = scrape_college_info(args.url, diagnostics=args.diagnostics, deadline=args.deadline,
+                                         assets=args.assets)
+        print(json.dumps(result, indent=2))
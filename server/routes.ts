@@ -1,4 +1,4 @@
-import type { Express, Request, Response } from "express";
+import express, { type Express, type Request, type Response } from "express";
 import { createServer, type Server } from "http";
 import { storage } from "./storage";
 import { insertUserSchema, insertMeetSchema, insertTeamSchema, insertDiverSchema, 
@@ -6,7 +6,7 @@ import { insertUserSchema, insertMeetSchema, insertTeamSchema, insertDiverSchema
          insertMeetJudgeSchema, insertSeasonSchema, insertSeasonCycleSchema,
          insertSeasonMeetSchema, insertPracticeScheduleSchema, insertMeetItinerarySchema } from "@shared/schema";
 import { ZodError } from 'zod';
-import { spawn } from 'child_process';
+import { scrapeCollege, SCRAPER_ASSET_DIR, SCRAPER_ASSET_URL } from './scraper';
 
 export async function registerRoutes(app: Express): Promise<Server> {
   // Error handling middleware
@@ -506,6 +506,14 @@ export async function registerRoutes(app: Express): Promise<Server> {
     }
   });
   
+  // Logo and coach photo thumbnails stored by the scraper. File names are
+  // content hashes, so they never change and can be cached for good.
+  app.use(SCRAPER_ASSET_URL, express.static(SCRAPER_ASSET_DIR, {
+    immutable: true,
+    maxAge: "365d",
+    fallthrough: false,
+  }));
+
   // College scraping endpoint
   app.post("/api/scrape-college", async (req: Request, res: Response) => {
     try {
@@ -544,75 +552,37 @@ export async function registerRoutes(app: Express): Promise<Server> {
         });
       }
       
-      // Call the Python scraper using child process
-      const python = spawn("python3", ["server/college_scraper.py", url]);
-      
-      let dataString = "";
-      
-      // Collect data from script
-      python.stdout.on("data", (data) => {
-        dataString += data.toString();
+      // Hand the lookup to the long-lived Python scraper worker, and stop it
+      // if the client disconnects before we answer
+      const abort = new AbortController();
+      res.on("close", () => {
+        if (!res.writableFinished) {
+          abort.abort();
+        }
       });
+
+      let result: any;
+      try {
+        result = await scrapeCollege(url, { signal: abort.signal });
+      } catch (error) {
+        const workerError = error as Error;
+        return res.status(500).json({
+          success: false,
+          error: "Failed to scrape college information",
+          details: workerError.message
+        });
+      }
       
-      let errorString = "";
-      
-      // Handle errors
-      python.stderr.on("data", (data) => {
-        errorString += data.toString();
-        console.error(`Python Error: ${data}`);
-      });
+      if (abort.signal.aborted) {
+        return;
+      }
+
+      // Check if the result already has a 'success' field
+      if (result.success === false) {
+        return res.status(400).json(result);
+      }
       
-      // Send response when script finishes
-      python.on("close", (code) => {
-        try {
-          if (code !== 0) {
-            return res.status(500).json({ 
-              success: false,
-              error: "Failed to scrape college information",
-              details: errorString || dataString
-            });
-          }
-          
-          if (!dataString || dataString.trim() === "") {
-            return res.status(500).json({
-              success: false,
-              error: "No data returned from college scraper",
-            });
-          }
-          
-          // Parse the JSON output
-          // Clean up dataString to ensure it only contains valid JSON
-          const jsonStartIndex = dataString.indexOf('{');
-          const jsonEndIndex = dataString.lastIndexOf('}') + 1;
-          
-          if (jsonStartIndex === -1 || jsonEndIndex === 0) {
-            return res.status(500).json({ 
-              success: false,
-              error: "Invalid JSON output from college scraper",
-              rawOutput: dataString
-            });
-          }
-          
-          const cleanJson = dataString.substring(jsonStartIndex, jsonEndIndex);
-          const result = JSON.parse(cleanJson);
-          
-          // Check if the result already has a 'success' field
-          if (result.success === false) {
-            return res.status(400).json(result);
-          }
-          
-          return res.status(200).json(result);
-        } catch (error) {
-          const parseError = error as Error;
-          console.error("Failed to parse Python output:", parseError);
-          return res.status(500).json({ 
-            success: false,
-            error: "Failed to parse college information",
-            rawOutput: dataString,
-            parseError: parseError.message
-          });
-        }
-      });
+      return res.status(200).json(result);
     } catch (err) {
       handleErrors(err, res);
     }
@@ -0,0 +1,155 @@
+import { spawn, type ChildProcessWithoutNullStreams } from 'child_process';
+import { cpus, tmpdir } from 'os';
+import path from 'path';
+import { createInterface } from 'readline';
+
+// Long-lived college scraper worker.
+// Instead of paying Python startup and imports for every lookup, we keep a
+// single `college_scraper.py --serve` process around and talk to it with
+// newline-delimited JSON. Each request carries an id so responses can come
+// back in any order.
+
+type PendingRequest = {
+  resolve: (result: any) => void;
+  reject: (error: Error) => void;
+};
+
+// Processes that parse and extract fetched pages, so CPU-bound work uses
+// more than one core. One core is left for the fetching threads; on a single
+// core parsing stays in those threads. Each process holds its own copy of the
+// parsers, so the default stops at MAX_DEFAULT_PARSE_WORKERS however many
+// cores the machine has.
+const MAX_DEFAULT_PARSE_WORKERS = 4;
+const SCRAPER_PARSE_WORKERS =
+  process.env.SCRAPER_PARSE_WORKERS || String(Math.min(Math.max(cpus().length - 1, 0), MAX_DEFAULT_PARSE_WORKERS));
+
+// Concurrent lookups, enough to keep every parse process busy
+const SCRAPER_WORKERS = process.env.SCRAPER_WORKERS || String(Math.max(4, Number(SCRAPER_PARSE_WORKERS) * 2));
+
+// Total time budget for one lookup, in seconds. When it runs out the worker
+// answers with whatever it found so far, marked `partial: true`.
+const SCRAPER_DEADLINE = Number(process.env.SCRAPER_DEADLINE || "20");
+
+// How long past its deadline a lookup may go unanswered before we give up on
+// it. This covers queueing in the worker and the final extraction; a request
+// the worker lost would otherwise wait forever.
+const SCRAPER_RESPONSE_GRACE_MS = 10_000;
+
+// Where the worker stores logo and coach photo thumbnails, and the URL they
+// are served under. Results reference them as `logoAsset`/`coachPhotoAsset`.
+export const SCRAPER_ASSET_DIR =
+  process.env.SCRAPER_ASSET_DIR || path.join(tmpdir(), "ripscore-scraper-assets");
+export const SCRAPER_ASSET_URL = "/scraper-assets";
+
+export type ScrapeOptions = {
+  deadline?: number;
+  // Aborting cancels the scrape in the worker, e.g. when the HTTP client goes away
+  signal?: AbortSignal;
+};
+
+let worker: ChildProcessWithoutNullStreams | null = null;
+let nextRequestId = 1;
+const pending = new Map<string, PendingRequest>();
+
+function failPending(error: Error) {
+  pending.forEach((request) => request.reject(error));
+  pending.clear();
+}
+
+function startWorker(): ChildProcessWithoutNullStreams {
+  const child = spawn("python3", [
+    "server/college_scraper.py",
+    "--serve",
+    "--workers",
+    SCRAPER_WORKERS,
+    "--parse-workers",
+    SCRAPER_PARSE_WORKERS,
+  ], {
+    env: { ...process.env, SCRAPER_ASSET_DIR, SCRAPER_ASSET_URL: `${SCRAPER_ASSET_URL}/` },
+  });
+
+  const lines = createInterface({ input: child.stdout });
+  lines.on("line", (line) => {
+    if (!line.trim()) {
+      return;
+    }
+
+    let result: any;
+    try {
+      result = JSON.parse(line);
+    } catch (error) {
+      console.error("Invalid JSON from college scraper worker:", line);
+      return;
+    }
+
+    const id = result.id != null ? String(result.id) : "";
+    const request = pending.get(id);
+    if (!request) {
+      return;
+    }
+    pending.delete(id);
+    delete result.id;
+    request.resolve(result);
+  });
+
+  child.stderr.on("data", (data) => {
+    console.error(`Python Error: ${data}`);
+  });
+
+  child.on("error", (error) => {
+    console.error("College scraper worker failed to start:", error);
+  });
+
+  child.on("close", (code) => {
+    if (worker === child) {
+      worker = null;
+    }
+    // Anything still waiting will never get an answer from this process
+    failPending(new Error(`College scraper worker exited with code ${code}`));
+  });
+
+  return child;
+}
+
+export function scrapeCollege(url: string, options: ScrapeOptions = {}): Promise<any> {
+  if (!worker) {
+    worker = startWorker();
+  }
+
+  const id = String(nextRequestId++);
+  const child = worker;
+  const deadline = options.deadline ?? SCRAPER_DEADLINE;
+  const { signal } = options;
+
+  return new Promise((resolve, reject) => {
+    const cancel = () => {
+      // The worker still answers the original request, with a partial result
+      if (pending.has(id)) {
+        child.stdin.write(JSON.stringify({ id: String(nextRequestId++), action: "cancel", target: id }) + "\n");
+      }
+    };
+
+    const timeout = setTimeout(() => {
+      // Stop the scrape in the worker too; its late answer is then ignored
+      cancel();
+      pending.delete(id);
+      signal?.removeEventListener("abort", cancel);
+      reject(new Error(`College scraper did not answer within ${deadline}s`));
+    }, deadline * 1000 + SCRAPER_RESPONSE_GRACE_MS);
+
+    pending.set(id, {
+      resolve: (result) => {
+        clearTimeout(timeout);
+        signal?.removeEventListener("abort", cancel);
+        resolve(result);
+      },
+      reject: (error) => {
+        clearTimeout(timeout);
+        signal?.removeEventListener("abort", cancel);
+        reject(error);
+      },
+    });
+    signal?.addEventListener("abort", cancel, { once: true });
+    child.stdin.write(JSON.stringify({ id, url, deadline, assets: true }) + "\n");
+  });
+}